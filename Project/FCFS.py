@@ -1,45 +1,157 @@
-from typing import List, Dict, Any
-
-def fcfs(arrival_time: List[int], burst_time: List[int], process_names: List[str]) -> Dict[str, Any]:
-    processes_info = []
-    
-    # Create a list of process info using the provided names
-    for index, at in enumerate(arrival_time):
-        job = process_names[index]  # Use the provided process name
-        processes_info.append({
-            'job': job,
-            'at': at,
-            'bt': burst_time[index]
-        })
-
-    # Sort processes by arrival time
-    processes_info.sort(key=lambda x: x['at'])
-
-    finish_time = []
-    gantt_chart_info = []
-
-    for index, process in enumerate(processes_info):
-        if index == 0 or process['at'] > finish_time[index - 1]:
-            finish_time.append(process['at'] + process['bt'])
-            gantt_chart_info.append({
-                'job': process['job'],
-                'start': process['at'],
-                'stop': finish_time[index]
-            })
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple
+
+from gantt import GanttChart
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
+
+def fcfs_events(processes: ProcessTable, arrival_order: Optional[List[int]] = None,
+                stats: Optional[SchedulerStats] = None, done: Optional[Set[int]] = None,
+                start_time: Optional[int] = None) -> Iterator[Event]:
+    at, bt = processes.at, processes.bt
+
+    # Sort processes by arrival time; when resuming a schedule, only the processes not in done
+    if arrival_order is None:
+        pending = [pid for pid in range(len(processes)) if pid not in done] if done else None
+        arrival_order = processes.sorted_ids(at, ids=pending)
+    elif done:
+        arrival_order = [pid for pid in arrival_order if pid not in done]
+
+    # A resumed schedule keeps the CPU busy until start_time
+    finish_time = start_time
+    for pid in arrival_order:
+        if finish_time is None or at[pid] > finish_time:
+            start_time = at[pid]
         else:
-            finish_time.append(finish_time[index - 1] + process['bt'])
-            gantt_chart_info.append({
-                'job': process['job'],
-                'start': finish_time[index - 1],
-                'stop': finish_time[index]
-            })
-
-        # Calculate turnaround time (TAT) and waiting time (WT)
-        process['ft'] = finish_time[index]
-        process['tat'] = finish_time[index] - process['at']
-        process['wat'] = finish_time[index] - process['at'] - process['bt']
+            start_time = finish_time
+        finish_time = start_time + bt[pid]
+        yield pid, start_time, finish_time, True
 
-    return {
-        'solvedProcessesInfo': processes_info,
+    if stats is not None:
+        # The arrival order is the queue: every process is queued and dispatched exactly once
+        stats.count(dispatches=len(arrival_order), queue_pushes=len(arrival_order), queue_pops=len(arrival_order))
+
+def fcfs(arrival_time: List[int], burst_time: List[int], process_names: List[str],
+         stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+         metrics: Optional[Metrics] = None) -> Dict[str, Any]:
+    # Create the process table using the provided names
+    with phase(stats, 'build'):
+        processes = ProcessTable(arrival_time, burst_time, process_names)
+        arrival_order = processes.sorted_ids(processes.at)
+
+    # Turnaround time (TAT) and waiting time (WT) are filled in as each process finishes
+    with phase(stats, 'schedule'):
+        gantt_chart_info = collect(processes, fcfs_events(processes, arrival_order, stats), progress, metrics=metrics)
+
+    with phase(stats, 'results'):
+        solved_processes_info = processes.view(arrival_order)
+
+    return attach(stats, {
+        'solvedProcessesInfo': solved_processes_info,
         'ganttChartInfo': gantt_chart_info  # Include Gantt chart info in the return
-    }
\ No newline at end of file
+    }, metrics)
+
+def iter_fcfs(arrival_time: List[int], burst_time: List[int], process_names: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    processes = ProcessTable(arrival_time, burst_time, process_names)
+    return stream(processes, fcfs_events(processes))
+
+
+def _require_numpy():
+    """Import NumPy on first use, so that fcfs() and the modules using it never pay for the import."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The vectorized FCFS variants require numpy (pip install numpy).") from None
+    return numpy
+
+
+def _fcfs_scan(at: Sequence[int], bt: Sequence[int], carry: Optional[int] = None) -> Sequence[int]:
+    """Finish times of arrival-sorted jobs: ft[i] = max(at[i], ft[i - 1]) + bt[i], as a max-plus prefix scan.
+
+    Unrolling the recurrence gives ft[i] = S[i] + max(carry, max over j <= i of (at[j] - S[j - 1]))
+    where S is the running burst sum and carry is the finish time of the job before at[0].
+    """
+    np = _require_numpy()
+    burst_sum = np.cumsum(bt)
+    start_bound = np.maximum.accumulate(at - (burst_sum - bt))
+    if carry is not None:
+        np.maximum(start_bound, carry, out=start_bound)
+    return burst_sum + start_bound
+
+
+def _fcfs_chunk_summary(at: Sequence[int], bt: Sequence[int]) -> Tuple[int, int]:
+    """Total burst and start bound of a chunk, enough to get its last finish time from any carry-in."""
+    np = _require_numpy()
+    burst_sum = np.cumsum(bt)
+    start_bound = np.max(at - (burst_sum - bt))
+    return int(burst_sum[-1]), int(start_bound)
+
+
+def _fcfs_result(at: Sequence[int], bt: Sequence[int], process_names: List[str],
+                 order: Sequence[int], ft_sorted: Sequence[int]) -> Dict[str, Any]:
+    np = _require_numpy()
+    ft = np.empty_like(ft_sorted)
+    ft[order] = ft_sorted
+    tat = ft - at
+    wat = tat - bt
+    processes = ProcessTable.from_columns(at, bt, process_names, ft=ft, tat=tat, wat=wat)
+
+    return {
+        'solvedProcessesInfo': processes.view(order),
+        'ganttChartInfo': GanttChart.from_columns(process_names, order, ft_sorted - bt[order], ft_sorted)
+    }
+
+
+def fcfs_vectorized(arrival_time: List[int], burst_time: List[int], process_names: List[str]) -> Dict[str, Any]:
+    """FCFS over NumPy arrays; same result as fcfs() with every column held in an int64 array."""
+    np = _require_numpy()
+    at = np.asarray(arrival_time, dtype=np.int64)
+    bt = np.asarray(burst_time, dtype=np.int64)
+    if len(at) != len(bt) or len(at) != len(process_names):
+        raise ValueError("Arrival times, burst times and process names must have the same length.")
+
+    # Stable sort keeps the submission order for equal arrival times, as in fcfs()
+    order = np.argsort(at, kind='stable')
+    return _fcfs_result(at, bt, process_names, order, _fcfs_scan(at[order], bt[order]))
+
+
+def fcfs_chunked(arrival_time: List[int], burst_time: List[int], process_names: List[str],
+                 chunk_size: int = 1 << 22, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Vectorized FCFS with the scan split into chunks that run on a pool of worker processes.
+
+    The first pass reduces every chunk to a (burst sum, start bound) pair, the pairs are folded
+    in order to get the finish time carried into each chunk, and the second pass scans every
+    chunk again from its carry.
+    """
+    np = _require_numpy()
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+    at = np.asarray(arrival_time, dtype=np.int64)
+    bt = np.asarray(burst_time, dtype=np.int64)
+    if len(at) != len(bt) or len(at) != len(process_names):
+        raise ValueError("Arrival times, burst times and process names must have the same length.")
+
+    order = np.argsort(at, kind='stable')
+    at_sorted = at[order]
+    bt_sorted = bt[order]
+    bounds = range(0, len(at_sorted), chunk_size)
+    at_chunks = [at_sorted[i:i + chunk_size] for i in bounds]
+    bt_chunks = [bt_sorted[i:i + chunk_size] for i in bounds]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        summaries = list(executor.map(_fcfs_chunk_summary, at_chunks, bt_chunks))
+
+        # Stitch the chunk boundaries: the carry into a chunk is the finish time of the previous one
+        carries = []
+        carry = None
+        for burst_total, start_bound in summaries:
+            carries.append(carry)
+            carry = burst_total + (start_bound if carry is None else max(carry, start_bound))
+
+        ft_chunks = list(executor.map(_fcfs_scan, at_chunks, bt_chunks, carries))
+
+    ft_sorted = np.concatenate(ft_chunks) if ft_chunks else np.empty(0, dtype=np.int64)
+    return _fcfs_result(at, bt, process_names, order, ft_sorted)
@@ -1,28 +1,23 @@
+import time
+
+START_TIME = time.perf_counter()  # Measured from here to the first idle event of the main loop
+
+import threading
 import tkinter as tk
-import os
-from tkinter import messagebox, ttk
-
-try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-except ImportError:
-    print("The matplotlib library is not installed. Installing it now...")
-    os.system("pip install matplotlib")
-    print("--------------------------------------------------------------------------")
-    print("Installation complete.")
-    print("--------------------------------------------------------------------------")
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-except Exception as e:
-    print(f"An error occurred: {e}")
-
-# Import your scheduling algorithms here
-from FCFS import fcfs
-from nnp import npp 
-from pp import pp  # Import the Preemptive Priority function
-from rr import rr  # Import the Round Robin function
-from sjf import sjf  # Import the Shortest Job First function
-from srtf import SRTFScheduler  # Import the SRTF scheduler
+from tkinter import filedialog, messagebox, ttk
+
+# The scheduling modules and matplotlib are imported on first use, not at startup
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, QUANTUM_ALGORITHMS, parse_quantum
+from cache import ResultCache
+from incremental import IncrementalScheduler
+from metrics import Metrics
+from progress import Progress, ScheduleCancelled
+from results_table import ResultsTable
+
+POLL_INTERVAL_MS = 100  # How often the UI checks on a running schedule
+
+# Combobox label -> algorithm key
+ALGORITHM_KEYS = {display_name: key for key, (display_name, _, _) in ALGORITHMS.items()}
 
 class SchedulerApp:
     def __init__(self, root):
@@ -34,6 +29,12 @@ class SchedulerApp:
         self.process_list = []  # List to store processes as dictionaries
         self.selected_algorithm = tk.StringVar(value="First Come First Serve (FCFS)")  # Default selection
         self.gantt_result = None  # Initialize Gantt result
+        self.startup_seconds = None  # Set by report_startup_time once the window is up
+        self.schedule_thread = None  # Worker thread of the schedule in progress, if any
+        self.schedule_outcome = None  # (result, error) left behind by the worker thread
+        self.progress = None  # Progress of the schedule in progress, used to cancel it
+        self.result_cache = ResultCache()  # Rescheduling an unchanged process list returns instantly
+        self.incremental = IncrementalScheduler()  # After an add or delete, only the affected part is rescheduled
 
         # Create frames for the scheduler and Gantt chart
         self.scheduler_frame = tk.Frame(root, bg="#f0f0f0")
@@ -88,14 +89,7 @@ class SchedulerApp:
         # Center the algorithm selection label and menu
         tk.Label(algorithm_frame, text="Select Scheduling Algorithm:", bg="#e0e0e0", font=("Arial", 12)).pack(side=tk.TOP, pady=5)
         self.algorithm_menu = ttk.Combobox(algorithm_frame, textvariable=self.selected_algorithm, font=("Arial", 12))
-        self.algorithm_menu['values'] = (
-            "First Come First Serve (FCFS)", 
-            "Non-Preemptive Priority (NPP)", 
-            "Preemptive Priority (PP)", 
-            "Round Robin (RR)",  
-            "Shortest Job First (SJF)",
-            "Shortest Remaining Time First (SRTF)"
-        )
+        self.algorithm_menu['values'] = tuple(ALGORITHM_KEYS)
         self.algorithm_menu.pack(side=tk.TOP, padx=5, pady=5)
         self.algorithm_menu.bind("<<ComboboxSelected>>", self.update_priority_input)
 
@@ -191,6 +185,20 @@ class SchedulerApp:
         self.schedule_button.bind("<Enter>", lambda e: self.on_hover(self.schedule_button, True))
         self.schedule_button.bind("<Leave>", lambda e: self.on_hover(self.schedule_button, False))
 
+        # Progress of a running schedule and a button to cancel it
+        self.status_label = tk.Label(self.scheduler_frame, text="", bg="#f0f0f0", font=("Arial", 11))
+        self.status_label.pack()
+        self.cancel_button = tk.Button(
+            self.scheduler_frame,
+            text="Cancel",
+            command=self.cancel_schedule,
+            bg="#f44336",
+            fg="white",
+            font=("Arial", 12),
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(pady=5)
+
                 
         # Initially hide the priority and quantum input
         self.priority_label = tk.Label(input_frame, text="Priorities (comma-separated):", bg="#e0e0e0", font=("Arial", 12))
@@ -312,7 +320,12 @@ class SchedulerApp:
             self.priority_entry.grid(row=3, column=1, padx=5, pady=5)
             self.quantum_label.grid_forget()
             self.quantum_entry.grid_forget()
-        elif self.selected_algorithm.get() == "Round Robin (RR)":
+        elif ALGORITHM_KEYS.get(self.selected_algorithm.get()) in QUANTUM_ALGORITHMS:
+            # MLFQ takes one quantum per level
+            if ALGORITHM_KEYS[self.selected_algorithm.get()] == 'mlfq':
+                self.quantum_label.config(text="Time Quanta (comma-separated):")
+            else:
+                self.quantum_label.config(text="Time Quantum:")
             self.quantum_label.grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
             self.quantum_entry.grid(row=3, column=1, padx=5, pady=5)
             self.priority_label.grid_forget()
@@ -329,6 +342,21 @@ class SchedulerApp:
             messagebox.showwarning("Warning", "Please schedule processes first to view the Gantt chart.")
             return
 
+        # Load the plotting backend only when a chart is actually requested
+        try:
+            from matplotlib.collections import PolyCollection
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        except ImportError:
+            messagebox.showerror("Error", "The Gantt chart needs the matplotlib library (pip install matplotlib).")
+            return
+
+        # Check if ganttChartInfo is available in the result
+        if 'ganttChartInfo' not in self.gantt_result or len(self.gantt_result['ganttChartInfo']) == 0:
+            messagebox.showerror("Error", "Gantt chart data is not available.")
+            return
+        gantt_chart_info = self.gantt_result['ganttChartInfo']
+
         gantt_window = tk.Toplevel(self.root)
         gantt_window.title("Gantt Chart")
         gantt_window.geometry("800x400")
@@ -340,22 +368,29 @@ class SchedulerApp:
         # Prepare data for Gantt chart
         colors = ['#FF9999', '#66B3FF', '#99FF99', '#FFCC99', '#FFD700', '#FF69B4', '#8A2BE2', '#FF4500', '#2E8B57', '#D2691E']
 
-        # Check if ganttChartInfo is available in the result
-        if 'ganttChartInfo' not in self.gantt_result:
-            messagebox.showerror("Error", "Gantt chart data is not available.")
-            return
-
-        for i, gantt in enumerate(self.gantt_result['ganttChartInfo']):
-            # Create a bar for each job with a different color
-            ax.barh(gantt['job'], gantt['stop'] - gantt['start'], left=gantt['start'], color=colors[i % len(colors)])
-
+        # Draw every segment as one PolyCollection instead of one artist per segment; one row and colour per job
+        lanes = gantt_chart_info.lanes()
+        bars = []
+        bar_colors = []
+        for row, segments in enumerate(lanes.values()):
+            color = colors[row % len(colors)]
+            for start, duration in segments:
+                stop = start + duration
+                bars.append(((start, row - 0.4), (start, row + 0.4), (stop, row + 0.4), (stop, row - 0.4)))
+                bar_colors.append(color)
+        ax.add_collection(PolyCollection(bars, facecolors=bar_colors, edgecolors='none'))
+        ax.set_ylim(-1, len(lanes))
+
+        # Label every row unless there are too many to read
+        if len(lanes) <= 50:
+            ax.set_yticks(range(len(lanes)))
+            ax.set_yticklabels(list(lanes))
         ax.set_xlabel('Time')
         ax.set_ylabel('Processes')
         ax.set_title('Gantt Chart')
 
         # Set x-axis limits dynamically based on the maximum end time
-        end_times = [gantt['stop'] for gantt in self.gantt_result['ganttChartInfo']]
-        ax.set_xlim(0, max(end_times) + 1)  # Add a little padding to the end time for better visualization
+        ax.set_xlim(0, max(gantt_chart_info.stops) + 1)  # Add a little padding to the end time for better visualization
 
         # Add the figure to the Tkinter frame
         canvas = FigureCanvasTkAgg(fig, master=gantt_window)
@@ -363,7 +398,10 @@ class SchedulerApp:
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
     def schedule_processes(self):
-        """Schedule the processes and display the results in a new window."""
+        """Validate the processes and schedule them on a worker thread, keeping the window responsive."""
+        if self.schedule_thread is not None:
+            return  # A schedule is already running
+
         try:
             # Extract process names, arrival times, and burst times from the process list
             process_names = [p['name'] for p in self.process_list]
@@ -373,36 +411,79 @@ class SchedulerApp:
             if len(process_names) == 0:
                 raise ValueError("No processes have been added.")
 
-            # Call the appropriate scheduling algorithm
-            if self.selected_algorithm.get() == "First Come First Serve (FCFS)":
-                result = fcfs(arrival_times, burst_times, process_names)
-            elif self.selected_algorithm.get() == "Non-Preemptive Priority (NPP)":
-                priorities = list(map(int, self.priority_entry.get().split(',')))
-                if len(arrival_times) != len(priorities):
-                    raise ValueError("Arrival times and priorities must have the same length.")
-                result = npp(arrival_times, burst_times, priorities, process_names)
-            elif self.selected_algorithm.get() == "Preemptive Priority (PP)":
+            algorithm = ALGORITHM_KEYS.get(self.selected_algorithm.get())
+            if algorithm is None:
+                raise ValueError("Please select a scheduling algorithm.")
+
+            # Call the appropriate scheduling algorithm; its module is imported on first use
+            priorities = None
+            time_quantum = None
+            if algorithm in PRIORITY_ALGORITHMS:
                 priorities = list(map(int, self.priority_entry.get().split(',')))
                 if len(arrival_times) != len(priorities):
                     raise ValueError("Arrival times and priorities must have the same length.")
-                result = pp(arrival_times, burst_times, priorities, process_names)
-            elif self.selected_algorithm.get() == "Round Robin (RR)":
-                time_quantum = int(self.quantum_entry.get())
-                result = rr(arrival_times, burst_times, time_quantum, process_names)
-            elif self.selected_algorithm.get() == "Shortest Job First (SJF)":
-                result = sjf(arrival_times, burst_times, process_names)
-            elif self.selected_algorithm.get() == "Shortest Remaining Time First (SRTF)":
-                scheduler = SRTFScheduler(arrival_times, burst_times, process_names)
-                result = scheduler.schedule()
-
-            # Store the Gantt chart result for later use
-            self.gantt_result = result  # Assuming result contains ganttChartInfo
-
-            # Display the results in a new window
-            self.show_results_window(result)
+            elif algorithm in QUANTUM_ALGORITHMS:
+                time_quantum = parse_quantum(self.quantum_entry.get())
 
         except ValueError as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        self.progress = Progress()
+        self.schedule_outcome = None
+        self.schedule_thread = threading.Thread(
+            target=self.run_schedule,
+            args=(algorithm, arrival_times, burst_times, process_names, priorities, time_quantum),
+            daemon=True
+        )
+        self.schedule_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.status_label.config(text="Scheduling...")
+        self.schedule_thread.start()
+        self.root.after(POLL_INTERVAL_MS, self.poll_schedule)
+
+    def run_schedule(self, *args):
+        """Worker thread body; Tk may only be used from the main thread, so the outcome is just stored."""
+        try:
+            result = self.result_cache.run(*args, progress=self.progress, runner=self.incremental.run,
+                                           metrics=Metrics())
+            self.schedule_outcome = (result, None)
+        except Exception as e:  # Reported by poll_schedule on the main thread
+            self.schedule_outcome = (None, e)
+
+    def poll_schedule(self):
+        """Show the progress of the running schedule, and its results once the worker thread is done."""
+        if self.schedule_thread.is_alive():
+            self.status_label.config(text=f"Scheduling... {self.progress.fraction():.0%}")
+            self.root.after(POLL_INTERVAL_MS, self.poll_schedule)
+            return
+
+        self.schedule_thread = None
+        self.progress = None
+        self.schedule_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+        result, error = self.schedule_outcome
+        self.schedule_outcome = None
+        if isinstance(error, ScheduleCancelled):
+            self.status_label.config(text="Scheduling cancelled.")
+            return
+        self.status_label.config(text="")
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+            return
+
+        # Store the Gantt chart result for later use
+        self.gantt_result = result  # Assuming result contains ganttChartInfo
+
+        # Display the results in a new window
+        self.show_results_window(result)
+
+    def cancel_schedule(self):
+        """Ask the running schedule to stop; poll_schedule notices once the worker thread exits."""
+        if self.progress is not None:
+            self.progress.cancel()
+            self.status_label.config(text="Cancelling...")
 
     def show_results_window(self, result):
         """Open a new window to display the scheduling results."""
@@ -410,40 +491,19 @@ class SchedulerApp:
         results_window.title("Scheduling Results")
         results_window.geometry("600x400")
 
-        # Create a Treeview to display the results
-        result_tree = ttk.Treeview(results_window, columns=("Job", "Arrival Time", "Burst Time", "Finish Time", "Turnaround Time", "Waiting Time"), show='headings')
-        result_tree.heading("Job", text="Job")
-        result_tree.heading("Arrival Time", text="Arrival Time")
-        result_tree.heading("Burst Time", text="Burst Time")
-        result_tree.heading("Finish Time", text="Finish Time")
-        result_tree.heading("Turnaround Time", text="Turnaround Time")
-        result_tree.heading("Waiting Time", text="Waiting Time")
-
-        # Center the numeric columns
-        for col in ["Arrival Time", "Burst Time", "Finish Time", "Turnaround Time", "Waiting Time"]:
-            result_tree.heading(col, anchor="center")
-            result_tree.column(col, anchor="center")
-
-        # Add the results to the Treeview
-        for process in result['solvedProcessesInfo']:
-            result_tree.insert("", "end", values=(
-                process['job'],
-                process['at'],
-                process['bt'],
-                process['ft'],
-                process['tat'],
-                process['wat']
-            ))
-
+        # Only the visible page of rows is put in the Treeview; click a heading to sort by it
+        result_tree = ResultsTable(
+            results_window,
+            result['solvedProcessesInfo'],
+            fields=("job", "at", "bt", "ft", "tat", "wat"),
+            headings=("Job", "Arrival Time", "Burst Time", "Finish Time", "Turnaround Time", "Waiting Time"),
+        )
         result_tree.pack(fill=tk.BOTH, expand=True)
 
-        # Calculate averages
-        total_tat = sum(process['tat'] for process in result['solvedProcessesInfo'])
-        total_wt = sum(process['wat'] for process in result['solvedProcessesInfo'])
-        num_processes = len(result['solvedProcessesInfo'])
-
-        avg_tat = total_tat / num_processes if num_processes > 0 else 0
-        avg_wt = total_wt / num_processes if num_processes > 0 else 0
+        # Averages are accumulated while scheduling, not recomputed here
+        summary = result['solvedProcessesInfo'].summary()
+        avg_tat = summary['averageTurnaroundTime']
+        avg_wt = summary['averageWaitingTime']
 
         # Display average turnaround time and waiting time
         avg_label_frame = tk.Frame(results_window)
@@ -455,11 +515,50 @@ class SchedulerApp:
         avg_wt_label = tk.Label(avg_label_frame, text=f"Average Waiting Time: {avg_wt:.2f}", font=("Arial", 12))
         avg_wt_label.pack(side=tk.LEFT, padx=10)
 
+        # Percentiles, response time and utilization, gathered while scheduling
+        metrics = result.get('metrics')
+        if metrics is not None:
+            lines = [
+                f"{label}: p50 {metrics[key]['p50']:.1f}   p95 {metrics[key]['p95']:.1f}   p99 {metrics[key]['p99']:.1f}"
+                for label, key in (("Turnaround Time", 'turnaroundTime'), ("Waiting Time", 'waitingTime'),
+                                   ("Response Time", 'responseTime'))
+            ]
+            lines.append(f"CPU Utilization: {metrics['utilization']:.1%}   Throughput: {metrics['throughput']:.3f}/unit   "
+                         f"Context Switches: {metrics['contextSwitches']}")
+            metrics_label = tk.Label(results_window, text="\n".join(lines), font=("Arial", 10), justify=tk.LEFT)
+            metrics_label.pack(pady=(0, 10))
+
+        export_button = tk.Button(results_window, text="Export...", command=lambda: self.export_results(result),
+                                  bg="#2196F3", fg="white", font=("Arial", 12))
+        export_button.pack(pady=(0, 5))
+
         # Add a button to close
                 # Add a button to close the results window
         close_button = tk.Button(results_window, text="Close", command=results_window.destroy, bg="#f44336", fg="white", font=("Arial", 12))
         close_button.pack(pady=10)
 
+    def export_results(self, result):
+        """Save the results as a columnar .npz archive, or as CSV (with the Gantt segments next to it)."""
+        path = filedialog.asksaveasfilename(
+            title="Export Results",
+            defaultextension=".npz",
+            filetypes=[("Columnar archive", "*.npz"), ("CSV", "*.csv")],
+        )
+        if not path:
+            return
+
+        from export import write_gantt_csv, write_npz, write_solved_csv
+        try:
+            if path.lower().endswith('.csv'):
+                with open(path, 'w', newline='') as f:
+                    write_solved_csv(result['solvedProcessesInfo'], f)
+                with open(path[:-len('.csv')] + '_gantt.csv', 'w', newline='') as f:
+                    write_gantt_csv(result['ganttChartInfo'], f)
+            else:
+                write_npz(result, path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export the results: {e}")
+
     def add_process(self):
         """Add a process to the process list."""
         name = self.name_entry.get()
@@ -491,12 +590,12 @@ class SchedulerApp:
             self.process_tree.insert("", "end", values=(process['name'], process['arrival_time'], process['burst_time'], process['priority']))
             self.process_list.append(process)
 
-        elif self.selected_algorithm.get() == "Round Robin (RR)":
-            time_quantum = self.quantum_entry.get()
-            if not time_quantum.isdigit():
-                messagebox.showerror("Error", "Please enter a valid time quantum.")
+        elif ALGORITHM_KEYS.get(self.selected_algorithm.get()) in QUANTUM_ALGORITHMS:
+            try:
+                process['time_quantum'] = parse_quantum(self.quantum_entry.get())
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
                 return
-            process['time_quantum'] = int(time_quantum)
             self.process_tree.insert("", "end", values=(process['name'], process['arrival_time'], process['burst_time'], process['time_quantum']))
             self.process_list.append(process)
 
@@ -527,7 +626,13 @@ class SchedulerApp:
         # Remove the selected item from the Treeview
         self.process_tree.delete(selected_item)
 
+    def report_startup_time(self):
+        """Remember how long it took until the main loop was first idle, and show it until the first schedule."""
+        self.startup_seconds = time.perf_counter() - START_TIME
+        self.status_label.config(text=f"Started in {self.startup_seconds * 1000:.0f} ms")
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = SchedulerApp(root)
+    root.after_idle(app.report_startup_time)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,14 @@
+from fractions import Fraction
+from typing import Tuple, Union
+
+
+def aging_ratio(aging: Union[int, float, Fraction]) -> Tuple[int, int]:
+    """Aging rate as an exact (numerator, denominator) pair; a float is read in decimal, so 0.1 is 1/10.
+
+    The priority engines scale their heap keys by the denominator, which keeps every key an
+    integer and every tie exact.
+    """
+    rate = Fraction(str(aging)) if isinstance(aging, float) else Fraction(aging)
+    if rate < 0:
+        raise ValueError("Aging rate must be non-negative.")
+    return rate.numerator, rate.denominator
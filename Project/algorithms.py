@@ -0,0 +1,81 @@
+import importlib
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
+
+from instrumentation import SchedulerStats
+from metrics import Metrics
+from progress import Progress
+
+# Algorithm key -> (display name, module, callable); modules are imported on first use
+ALGORITHMS = {
+    'fcfs': ("First Come First Serve (FCFS)", 'FCFS', 'fcfs'),
+    'mlfq': ("Multi-Level Feedback Queue (MLFQ)", 'mlfq', 'mlfq'),
+    'npp': ("Non-Preemptive Priority (NPP)", 'nnp', 'npp'),
+    'pp': ("Preemptive Priority (PP)", 'pp', 'pp'),
+    'rr': ("Round Robin (RR)", 'rr', 'rr'),
+    'sjf': ("Shortest Job First (SJF)", 'sjf', 'sjf'),
+    'srtf': ("Shortest Remaining Time First (SRTF)", 'srtf', 'SRTFScheduler'),
+}
+
+# Algorithm key -> (module, engine) for the schedulers whose event generator can run on a ProcessTable directly
+ENGINES = {
+    'fcfs': ('FCFS', 'fcfs_events'),
+    'npp': ('nnp', 'npp_events'),
+    'pp': ('pp', 'pp_events'),
+    'rr': ('rr', 'rr_events'),
+    'sjf': ('sjf', 'sjf_events'),
+    'srtf': ('srtf', 'srtf_events'),
+}
+
+PRIORITY_ALGORITHMS = ('npp', 'pp')
+QUANTUM_ALGORITHMS = ('rr', 'mlfq')  # mlfq also takes one quantum per level
+
+
+def parse_quantum(text: str) -> Union[int, Tuple[int, ...]]:
+    """Parse a time quantum ('4') or comma-separated per-level quanta ('2,4,8')."""
+    parts = [part.strip() for part in text.split(',')]
+    if not all(part.isdigit() for part in parts):
+        raise ValueError("Please enter a valid time quantum.")
+    quanta = tuple(int(part) for part in parts)
+    return quanta[0] if len(quanta) == 1 else quanta
+
+
+def load(algorithm: str):
+    """Import and return the scheduling function (or scheduler class) of an algorithm key."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    _, module_name, attribute = ALGORITHMS[algorithm]
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def load_engine(algorithm: str):
+    """Import and return the event generator of an algorithm key."""
+    if algorithm not in ENGINES:
+        raise ValueError(f"No event engine for scheduling algorithm: {algorithm}")
+    module_name, attribute = ENGINES[algorithm]
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def run_algorithm(algorithm: str, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+                  priorities: Optional[Sequence[int]] = None, time_quantum: Optional[int] = None,
+                  stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+                  metrics: Optional[Metrics] = None, aging: float = 0) -> Dict[str, Any]:
+    """Run one algorithm by key with the argument order each scheduler expects.
+
+    aging is the rate at which waiting processes gain priority; only the priority algorithms use it.
+    """
+    scheduler = load(algorithm)
+    if algorithm in PRIORITY_ALGORITHMS:
+        if priorities is None:
+            raise ValueError(f"{ALGORITHMS[algorithm][0]} requires priorities.")
+        return scheduler(arrival_time, burst_time, priorities, process_names, stats=stats, progress=progress,
+                         metrics=metrics, aging=aging)
+    if algorithm in QUANTUM_ALGORITHMS:
+        if time_quantum is None:
+            raise ValueError(f"{ALGORITHMS[algorithm][0]} requires a time quantum.")
+        if algorithm == 'rr' and not isinstance(time_quantum, int):
+            raise ValueError("Round Robin takes a single time quantum.")
+        return scheduler(arrival_time, burst_time, time_quantum, process_names, stats=stats, progress=progress,
+                         metrics=metrics)
+    if algorithm == 'srtf':
+        return scheduler(arrival_time, burst_time, process_names, stats=stats, progress=progress, metrics=metrics).schedule()
+    return scheduler(arrival_time, burst_time, process_names, stats=stats, progress=progress, metrics=metrics)
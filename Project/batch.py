@@ -0,0 +1,138 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, run_algorithm
+from cache import ResultCache, fingerprint
+from gantt import GanttChart
+from process_table import ProcessTable
+
+# Each workload occupies three int64 columns (arrival, burst, priority) in the shared block
+COLUMNS = 3
+
+
+def _read_column(buf: memoryview, start: int, n: int) -> array:
+    """Copy n int64 values starting at item offset start out of the shared block."""
+    column = array('q')
+    with buf[8 * start:8 * (start + n)] as view:
+        column.frombytes(view)
+    return column
+
+
+def _run_task(shm_name: str, offset: int, n: int, has_priorities: bool, algorithm: str,
+              time_quantum: Optional[int]) -> Tuple[array, ...]:
+    """Worker side: read one workload from shared memory, schedule it and return the numeric result columns."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        at = _read_column(shm.buf, offset, n)
+        bt = _read_column(shm.buf, offset + n, n)
+        priorities = _read_column(shm.buf, offset + 2 * n, n) if has_priorities else None
+    finally:
+        shm.close()
+
+    # Names are only needed for display, so the parent reattaches them; ids stand in here
+    result = run_algorithm(algorithm, at, bt, range(n), priorities, time_quantum)
+    processes = result['solvedProcessesInfo'].table
+    gantt = result['ganttChartInfo']
+    return processes.ft, processes.tat, processes.wat, gantt.jobs, gantt.starts, gantt.stops
+
+
+def _pack(workloads: Sequence[Dict[str, Any]]) -> Tuple[shared_memory.SharedMemory, List[int]]:
+    """Copy the arrival/burst/priority columns of every workload into one shared memory block."""
+    offsets = []
+    total = 0
+    for workload in workloads:
+        offsets.append(total)
+        total += COLUMNS * len(workload['arrival_time'])
+
+    shm = shared_memory.SharedMemory(create=True, size=max(8 * total, 1))
+    columns = shm.buf.cast('q')
+    try:
+        for offset, workload in zip(offsets, workloads):
+            n = len(workload['arrival_time'])
+            columns[offset:offset + n] = array('q', workload['arrival_time'])
+            columns[offset + n:offset + 2 * n] = array('q', workload['burst_time'])
+            if workload.get('priorities') is not None:
+                columns[offset + 2 * n:offset + 3 * n] = array('q', workload['priorities'])
+    finally:
+        columns.release()
+    return shm, offsets
+
+
+def run_batch(workloads: Sequence[Dict[str, Any]], algorithms: Sequence[str] = tuple(ALGORITHMS),
+              time_quantum: Optional[int] = None, max_workers: Optional[int] = None,
+              cache: Optional[ResultCache] = None) -> List[Dict[str, Dict[str, Any]]]:
+    """Schedule every workload with every algorithm on a pool of worker processes.
+
+    A workload is a dict with 'arrival_time', 'burst_time', 'process_names' and optionally
+    'priorities'. The input columns travel through multiprocessing.shared_memory; only the
+    numeric result columns are pickled back. Returns, per workload, a dict mapping each
+    algorithm key to the usual {'solvedProcessesInfo', 'ganttChartInfo'} result.
+    With a cache, only the (workload, algorithm) pairs it does not hold are scheduled.
+    """
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    for workload in workloads:
+        n = len(workload['arrival_time'])
+        if len(workload['burst_time']) != n or len(workload['process_names']) != n:
+            raise ValueError("Arrival times, burst times and process names must have the same length.")
+        if workload.get('priorities') is not None and len(workload['priorities']) != n:
+            raise ValueError("Arrival times and priorities must have the same length.")
+        if workload.get('priorities') is None and any(a in PRIORITY_ALGORITHMS for a in algorithms):
+            raise ValueError("Priority algorithms require priorities for every workload.")
+    if 'rr' in algorithms and (not isinstance(time_quantum, int) or time_quantum <= 0):
+        raise ValueError("Time quantum must be a positive integer.")
+    if 'mlfq' in algorithms and time_quantum is None:
+        raise ValueError("Multi-Level Feedback Queue requires a time quantum.")
+
+    # Look every (workload, algorithm) pair up in the cache; only the misses go to the pool
+    results = [{} for _ in workloads]
+    misses = []
+    for index, workload in enumerate(workloads):
+        for algorithm in algorithms:
+            key = None
+            if cache is not None:
+                key = fingerprint(algorithm, workload['arrival_time'], workload['burst_time'],
+                                  workload['process_names'], workload.get('priorities'), time_quantum)
+                result = cache.get(key)
+                if result is not None:
+                    results[index][algorithm] = result
+                    continue
+            misses.append((index, algorithm, key))
+    if not misses:
+        return results
+
+    shm, offsets = _pack(workloads)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_task, shm.name, offsets[index], len(workloads[index]['arrival_time']),
+                                workloads[index].get('priorities') is not None, algorithm, time_quantum)
+                for index, algorithm, _ in misses
+            ]
+            for (index, algorithm, key), future in zip(misses, futures):
+                result = _rebuild(workloads[index], algorithm, future.result())
+                if cache is not None:
+                    cache.put(key, result)
+                results[index][algorithm] = result
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Keep each workload's algorithms in the order they were asked for
+    return [{algorithm: workload_results[algorithm] for algorithm in algorithms} for workload_results in results]
+
+
+def _rebuild(workload: Dict[str, Any], algorithm: str, columns: Tuple[array, ...]) -> Dict[str, Any]:
+    """Reattach the workload's names and inputs to the result columns returned by a worker."""
+    ft, tat, wat, jobs, starts, stops = columns
+    names = workload['process_names']
+    priorities = workload.get('priorities')
+    processes = ProcessTable.from_columns(
+        array('q', workload['arrival_time']), array('q', workload['burst_time']), names,
+        array('q', priorities) if priorities is not None and algorithm in PRIORITY_ALGORITHMS else None,
+        ft, tat, wat,
+    )
+    return {'solvedProcessesInfo': processes.result_view(algorithm), 'ganttChartInfo': GanttChart.from_columns(names, jobs, starts, stops)}
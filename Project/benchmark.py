@@ -0,0 +1,185 @@
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Dict, Any, Optional, Sequence
+
+from algorithms import ALGORITHMS, load as load_scheduler, run_algorithm
+
+BURST_DISTRIBUTIONS = ('exponential', 'pareto', 'bimodal')
+PRIORITY_DISTRIBUTIONS = ('uniform', 'zipf')
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+MEASURED_FIELDS = ('seconds', 'peak_bytes', 'jobs_per_second', 'segments')
+
+
+def generate_workload(n: int, seed: int = 0, load: float = 0.9, burst: str = 'exponential', mean_burst: float = 5.0,
+                      priority: str = 'uniform', priority_levels: int = 5, pareto_alpha: float = 1.5) -> Dict[str, List[Any]]:
+    """Generate a reproducible workload with Poisson arrivals.
+
+    Arrivals are spaced by exponential gaps with rate load / mean_burst, so load is the
+    offered CPU utilization. Bursts are integers >= 1 drawn from the chosen distribution
+    with the given mean; bimodal mixes 80% short jobs with 20% jobs ten times longer.
+    """
+    if burst not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Unknown burst distribution: {burst}")
+    if priority not in PRIORITY_DISTRIBUTIONS:
+        raise ValueError(f"Unknown priority distribution: {priority}")
+    if n < 0 or load <= 0 or mean_burst <= 0 or priority_levels <= 0:
+        raise ValueError("Workload size must be non-negative and load, mean burst and priority levels positive.")
+
+    rng = random.Random(seed)
+    arrival_rate = load / mean_burst
+
+    arrival_time = []
+    clock = 0.0
+    for _ in range(n):
+        clock += rng.expovariate(arrival_rate)
+        arrival_time.append(int(clock))
+
+    if burst == 'exponential':
+        raw_bursts = [rng.expovariate(1 / mean_burst) for _ in range(n)]
+    elif burst == 'pareto':
+        # paretovariate has minimum 1 and mean alpha / (alpha - 1); rescale to mean_burst
+        scale = mean_burst * (pareto_alpha - 1) / pareto_alpha if pareto_alpha > 1 else mean_burst
+        raw_bursts = [scale * rng.paretovariate(pareto_alpha) for _ in range(n)]
+    else:
+        short_mean = mean_burst / 2.8  # 0.8 * m + 0.2 * 10 * m = 2.8 * m
+        raw_bursts = [rng.expovariate(1 / (short_mean if rng.random() < 0.8 else 10 * short_mean)) for _ in range(n)]
+    burst_time = [max(1, math.ceil(b)) for b in raw_bursts]
+
+    levels = range(1, priority_levels + 1)
+    if priority == 'uniform':
+        priorities = [rng.choice(levels) for _ in range(n)]
+    else:
+        # Zipf-like skew: most jobs get the lowest-urgency levels, few get level 1
+        weights = [1 / k for k in range(priority_levels, 0, -1)]
+        priorities = rng.choices(levels, weights=weights, k=n)
+
+    return {
+        'arrival_time': arrival_time,
+        'burst_time': burst_time,
+        'priorities': priorities,
+        'process_names': [f"P{index}" for index in range(n)],
+    }
+
+
+def measure(algorithm: str, workload: Dict[str, List[Any]], time_quantum: int = 4,
+            trace_memory: bool = True) -> Dict[str, Any]:
+    """Run one algorithm on one workload and report wall time, peak memory and throughput."""
+    args = (algorithm, workload['arrival_time'], workload['burst_time'], workload['process_names'],
+            workload['priorities'], time_quantum)
+
+    load_scheduler(algorithm)  # Keep the module import out of the timing
+
+    start = time.perf_counter()
+    result = run_algorithm(*args)
+    seconds = time.perf_counter() - start
+
+    peak_bytes = None
+    if trace_memory:
+        # A second, traced run: tracemalloc slows allocation down too much to time the same run
+        tracemalloc.start()
+        try:
+            run_algorithm(*args)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    jobs = len(workload['arrival_time'])
+    return {
+        'algorithm': algorithm,
+        'jobs': jobs,
+        'seconds': seconds,
+        'peak_bytes': peak_bytes,
+        'jobs_per_second': jobs / seconds if seconds > 0 else None,
+        'segments': len(result['ganttChartInfo']),
+    }
+
+
+def run_benchmark(sizes: Sequence[int] = DEFAULT_SIZES, algorithms: Sequence[str] = tuple(ALGORITHMS), seed: int = 0,
+                  time_quantum: int = 4, trace_memory: bool = True, **workload_options) -> List[Dict[str, Any]]:
+    rows = []
+    for n in sizes:
+        workload = generate_workload(n, seed=seed, **workload_options)
+        for algorithm in algorithms:
+            row = measure(algorithm, workload, time_quantum, trace_memory)
+            row.update(seed=seed, time_quantum=time_quantum, **workload_options)
+            rows.append(row)
+            print(f"{algorithm:>5} {n:>9} jobs  {row['seconds']:9.3f} s  "
+                  f"{row['jobs_per_second'] or 0:12.0f} jobs/s", file=sys.stderr)
+    return rows
+
+
+def find_regressions(rows: Sequence[Dict[str, Any]], baseline: Sequence[Dict[str, Any]],
+                     tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """Rows whose wall time grew by more than tolerance relative to the matching baseline row."""
+    def configuration(row):
+        return tuple(sorted((k, v) for k, v in row.items() if k not in MEASURED_FIELDS))
+
+    previous = {configuration(row): row for row in baseline}
+    regressions = []
+    for row in rows:
+        base = previous.get(configuration(row))
+        if base and base['seconds'] > 0 and row['seconds'] > base['seconds'] * (1 + tolerance):
+            regressions.append({
+                'algorithm': row['algorithm'],
+                'jobs': row['jobs'],
+                'baseline_seconds': base['seconds'],
+                'seconds': row['seconds'],
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the scheduling algorithms.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated workload sizes (default: %(default)s)")
+    parser.add_argument('--algorithms', default=','.join(ALGORITHMS),
+                        help="comma-separated algorithm keys (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quantum', type=int, default=4, help="Round Robin time quantum")
+    parser.add_argument('--load', type=float, default=0.9, help="offered CPU load")
+    parser.add_argument('--burst', choices=BURST_DISTRIBUTIONS, default='exponential')
+    parser.add_argument('--mean-burst', type=float, default=5.0)
+    parser.add_argument('--priority', choices=PRIORITY_DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--priority-levels', type=int, default=5)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc peak-memory run")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--baseline', help="JSON report to compare against; exit 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        algorithms=args.algorithms.split(','),
+        seed=args.seed,
+        time_quantum=args.quantum,
+        trace_memory=not args.no_memory,
+        load=args.load,
+        burst=args.burst,
+        mean_burst=args.mean_burst,
+        priority=args.priority,
+        priority_levels=args.priority_levels,
+    )
+    report = {'results': rows}
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(rows, json.load(f)['results'], args.tolerance)
+        report['regressions'] = regressions
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, Sequence
+
+from aging import aging_ratio
+from algorithms import PRIORITY_ALGORITHMS, QUANTUM_ALGORITHMS, run_algorithm
+from metrics import Metrics
+from progress import Progress
+
+# Bump when a scheduler's output changes, so stale on-disk entries stop matching
+CACHE_VERSION = 1
+
+
+def _column_bytes(column: Sequence[int]):
+    """Return the column as an int64 buffer, without copying when it already is one."""
+    if isinstance(column, array) and column.typecode == 'q':
+        return column
+    if hasattr(column, 'astype'):  # NumPy arrays
+        return column.astype('<i8').tobytes()
+    return array('q', column)
+
+
+def fingerprint(algorithm: str, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+                priorities: Optional[Sequence[int]] = None, time_quantum: Optional[int] = None, aging: float = 0) -> str:
+    """Hash a scheduling request; inputs the algorithm ignores (priorities, quantum, aging) do not change the key."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"v{CACHE_VERSION}:{algorithm}:{len(arrival_time)}".encode())
+    if algorithm in QUANTUM_ALGORITHMS:
+        # Per-level quanta hash the same whether given as a list or a tuple
+        quanta = time_quantum if isinstance(time_quantum, int) or time_quantum is None else tuple(time_quantum)
+        h.update(f":q{quanta}".encode())
+    h.update(_column_bytes(arrival_time))
+    h.update(_column_bytes(burst_time))
+    if algorithm in PRIORITY_ALGORITHMS and priorities is not None:
+        h.update(b'p')
+        h.update(_column_bytes(priorities))
+        if aging:
+            # The exact rate, so that 0.1 and Fraction(1, 10) share a key
+            h.update(":a{}/{}".format(*aging_ratio(aging)).encode())
+
+    # Name lengths first, so that e.g. ['ab', 'c'] and ['a', 'bc'] hash differently
+    encoded = [str(name).encode() for name in process_names]
+    h.update(array('q', map(len, encoded)))
+    h.update(b''.join(encoded))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Scheduling results keyed by fingerprint(): an in-memory LRU with an optional on-disk tier.
+
+    The disk tier keeps one pickle per result in directory and evicts the least recently
+    used files once they take more than max_disk_bytes. Cached results are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 32, directory: Optional[str] = None, max_disk_bytes: int = 1 << 30):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()  # The GUI fills the cache from its worker thread
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    result = pickle.load(f)
+                os.utime(path)  # Mark as recently used for eviction
+            except (OSError, pickle.UnpicklingError, EOFError):
+                result = None
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                return result
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self._remember(key, result)
+        if self.directory is not None:
+            self._write(key, result)
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _write(self, key: str, result: Dict[str, Any]) -> None:
+        # Write to a temporary file first so readers never see a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used pickles until the disk tier fits in max_disk_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.pickle'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # Already evicted by another writer
+            total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.directory is not None:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.pickle'):
+                        os.unlink(entry.path)
+
+    def run(self, algorithm: str, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+            priorities: Optional[Sequence[int]] = None, time_quantum: Optional[int] = None,
+            progress: Optional[Progress] = None, runner: Callable[..., Dict[str, Any]] = run_algorithm,
+            metrics: Optional[Metrics] = None, aging: float = 0) -> Dict[str, Any]:
+        """runner (run_algorithm by default), returning the cached result when the same request was scheduled before.
+
+        metrics is only filled on a miss; a cached result keeps the result['metrics'] it was stored with.
+        """
+        key = fingerprint(algorithm, arrival_time, burst_time, process_names, priorities, time_quantum, aging)
+        result = self.get(key)
+        if result is None:
+            result = runner(algorithm, arrival_time, burst_time, process_names, priorities, time_quantum,
+                            progress=progress, metrics=metrics, aging=aging)
+            self.put(key, result)
+        return result
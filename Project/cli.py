@@ -0,0 +1,173 @@
+"""Headless command-line entry point; never imports tkinter or matplotlib.
+
+Example:
+    python cli.py processes.csv --algorithm rr --quantum 4 --output results.json
+"""
+import argparse
+import csv
+import json
+import sys
+from typing import List, Dict, Any, Optional, Sequence, TextIO
+
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, QUANTUM_ALGORITHMS, parse_quantum, run_algorithm
+from export import write_gantt_csv, write_npz, write_solved_csv
+from metrics import Metrics
+
+# Accepted column names for each process field, first one is canonical
+FIELDS = {
+    'name': ('name', 'job', 'process_name'),
+    'arrival_time': ('arrival_time', 'at', 'arrival'),
+    'burst_time': ('burst_time', 'bt', 'burst'),
+    'priority': ('priority',),
+}
+
+
+def _field(row: Dict[str, Any], field: str, required: bool = True):
+    for alias in FIELDS[field]:
+        if alias in row and row[alias] not in (None, ''):
+            return row[alias]
+    if required:
+        raise ValueError(f"Missing '{field}' for process {row!r}.")
+    return None
+
+
+def normalize_processes(rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn raw CSV/JSON rows into the {'name', 'arrival_time', 'burst_time'[, 'priority']} dicts the GUI uses."""
+    processes = []
+    for row in rows:
+        process = {
+            'name': str(_field(row, 'name')),
+            'arrival_time': int(_field(row, 'arrival_time')),
+            'burst_time': int(_field(row, 'burst_time')),
+        }
+        priority = _field(row, 'priority', required=False)
+        if priority is not None:
+            process['priority'] = int(priority)
+        processes.append(process)
+    return processes
+
+
+def read_processes(path: str, input_format: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Read processes from a CSV file with a header row, or from JSON (a list of objects or a dict of columns)."""
+    if input_format is None:
+        input_format = 'json' if path.lower().endswith('.json') else 'csv'
+
+    with (sys.stdin if path == '-' else open(path, newline='')) as f:
+        if input_format == 'csv':
+            return normalize_processes(list(csv.DictReader(f)))
+
+        data = json.load(f)
+        if isinstance(data, dict):
+            if 'processes' in data:
+                data = data['processes']
+            else:
+                # Columnar form: {"name": [...], "arrival_time": [...], ...}
+                columns = list(data)
+                data = [dict(zip(columns, values)) for values in zip(*data.values())]
+        return normalize_processes(data)
+
+
+def write_results(result: Dict[str, Any], f: TextIO, output_format: str = 'json') -> None:
+    solved = result['solvedProcessesInfo']
+    if output_format == 'csv':
+        write_solved_csv(solved, f)
+        return
+
+    summary = solved.summary()
+    report = {
+        'solvedProcessesInfo': list(solved),
+        'ganttChartInfo': list(result['ganttChartInfo']),
+        'averageTurnaroundTime': summary['averageTurnaroundTime'],
+        'averageWaitingTime': summary['averageWaitingTime'],
+    }
+    if 'metrics' in result:
+        report['metrics'] = result['metrics']
+    if 'coreGanttChartInfo' in result:
+        report['coreGanttChartInfo'] = [list(chart) for chart in result['coreGanttChartInfo']]
+        report['smpInfo'] = result['smpInfo']
+    json.dump(report, f, indent=2)
+    f.write('\n')
+
+
+def write_gantt(result: Dict[str, Any], f: TextIO) -> None:
+    write_gantt_csv(result['ganttChartInfo'], f)
+
+
+def schedule(processes: Sequence[Dict[str, Any]], algorithm: str, time_quantum: Optional[int] = None,
+             cores: Optional[int] = None, metrics: Optional[Metrics] = None, aging: float = 0) -> Dict[str, Any]:
+    """Schedule a list of process dicts (the GUI's process_list shape) with an algorithm key, on cores simulated CPUs if given."""
+    if not processes:
+        raise ValueError("No processes have been added.")
+    priorities = None
+    if algorithm in PRIORITY_ALGORITHMS:
+        if any('priority' not in p for p in processes):
+            raise ValueError("Every process needs a priority for this algorithm.")
+        priorities = [p['priority'] for p in processes]
+    if cores is not None:
+        from smp import smp
+        return smp([p['arrival_time'] for p in processes], [p['burst_time'] for p in processes],
+                   [p['name'] for p in processes], cores, algorithm, priorities, time_quantum)
+    return run_algorithm(
+        algorithm,
+        [p['arrival_time'] for p in processes],
+        [p['burst_time'] for p in processes],
+        [p['name'] for p in processes],
+        priorities,
+        time_quantum,
+        metrics=metrics,
+        aging=aging,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a CPU scheduling algorithm without the GUI.")
+    parser.add_argument('input', help="CSV or JSON file with name, arrival_time, burst_time[, priority]; '-' for stdin")
+    parser.add_argument('-a', '--algorithm', choices=list(ALGORITHMS), default='fcfs')
+    parser.add_argument('-q', '--quantum', type=parse_quantum,
+                        help="time quantum for Round Robin; for MLFQ one quantum or comma-separated per-level quanta")
+    parser.add_argument('--cores', type=int, help="simulate this many CPUs with per-core ready queues")
+    parser.add_argument('--aging', type=float, default=0,
+                        help="priority gained per time unit of waiting, for the priority algorithms (default: no aging)")
+    parser.add_argument('--input-format', choices=('csv', 'json'), help="default: guessed from the file extension")
+    parser.add_argument('-o', '--output', help="results file (default: stdout)")
+    parser.add_argument('--format', choices=('json', 'csv', 'npz'), default='json',
+                        help="results format; npz (columnar, for reloading with export.read_npz) needs --output")
+    parser.add_argument('--gantt', help="also write the Gantt segments to this CSV file")
+    parser.add_argument('--metrics', action='store_true',
+                        help="add percentiles, response time, utilization and context switches to the JSON output")
+    args = parser.parse_args(argv)
+
+    if args.algorithm in QUANTUM_ALGORITHMS and args.quantum is None:
+        parser.error(f"--quantum is required for {args.algorithm}")
+    if args.format == 'npz' and not args.output:
+        parser.error("--format npz requires --output")
+    if args.metrics and args.cores is not None:
+        parser.error("--metrics is not available with --cores")
+    if args.aging < 0:
+        parser.error("--aging must be non-negative")
+    if args.aging and args.cores is not None:
+        parser.error("--aging is not available with --cores")
+
+    try:
+        result = schedule(read_processes(args.input, args.input_format), args.algorithm, args.quantum, args.cores,
+                          Metrics() if args.metrics else None, args.aging)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == 'npz':
+        write_npz(result, args.output)
+    elif args.output:
+        with open(args.output, 'w', newline='') as f:
+            write_results(result, f, args.format)
+    else:
+        write_results(result, sys.stdout, args.format)
+
+    if args.gantt:
+        with open(args.gantt, 'w', newline='') as f:
+            write_gantt(result, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Export scheduling results as columnar .npz archives or CSV, and load the archives back.
+
+The .npz layout is written without NumPy (np.load reads it as usual):
+    job, at, bt[, priority], ft, tat, wat     one int64 entry per solved process, in view order
+    job_dictionary_data / _offsets             job is an index into this dictionary of UTF-8 names
+    gantt_row, gantt_start, gantt_stop         gantt_row is the index of the segment's process above
+"""
+import ast
+import csv
+import struct
+import sys
+import zipfile
+from array import array
+from typing import Dict, Any, Iterable, Optional, Sequence, TextIO, Tuple
+
+from gantt import GanttChart
+from process_table import ProcessTable, ProcessView
+
+SOLVED_COLUMNS = ('job', 'at', 'bt', 'priority', 'ft', 'tat', 'wat')
+GANTT_COLUMNS = ('job', 'start', 'stop')
+
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+_NATIVE = sys.byteorder == 'little'  # .npy entries are written little-endian
+
+
+def _npy_header(descr: str, length: int) -> bytes:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}".encode('latin1')
+    # The data starts at a multiple of 64 bytes, as np.save does it
+    header += b' ' * (63 - (len(NPY_MAGIC) + 2 + len(header)) % 64) + b'\n'
+    return NPY_MAGIC + struct.pack('<H', len(header)) + header
+
+
+def _write_member(archive: zipfile.ZipFile, name: str, descr: str, data) -> None:
+    if descr == '<i8' and not _NATIVE:
+        data = array('q', data)
+        data.byteswap()
+    with archive.open(name + '.npy', 'w', force_zip64=True) as f:
+        f.write(_npy_header(descr, len(data)))
+        f.write(data)
+
+
+def _read_member(archive: zipfile.ZipFile, name: str):
+    raw = archive.read(name + '.npy')
+    if raw[:len(NPY_MAGIC)] != NPY_MAGIC:
+        raise ValueError(f"{name} is not a version 1.0 .npy entry.")
+    header_size = struct.unpack_from('<H', raw, len(NPY_MAGIC))[0]
+    data_start = len(NPY_MAGIC) + 2 + header_size
+    header = ast.literal_eval(raw[len(NPY_MAGIC) + 2:data_start].decode('latin1'))
+    if header['fortran_order'] or len(header['shape']) != 1:
+        raise ValueError(f"{name} is not a one-dimensional array.")
+    if header['descr'] == '|u1':
+        return raw[data_start:]
+    if header['descr'] != '<i8':
+        raise ValueError(f"{name} has unsupported type {header['descr']}.")
+    column = array('q')
+    column.frombytes(memoryview(raw)[data_start:])
+    if not _NATIVE:
+        column.byteswap()
+    return column
+
+
+def _take(column: Sequence[int], order: Sequence[int]) -> array:
+    """Column values in view order as an int64 array."""
+    if isinstance(order, range) and order == range(len(column)):
+        return column if isinstance(column, array) and column.typecode == 'q' else array('q', column)
+    return array('q', map(column.__getitem__, order))
+
+
+def _dictionary(names: Iterable[str]) -> Tuple[array, bytes, array]:
+    """Encode names as (codes, dictionary data, dictionary offsets), the dictionary in first-seen order."""
+    codes = {}
+    job = array('q', (codes.setdefault(str(name), len(codes)) for name in names))
+    encoded = [name.encode() for name in codes]
+    offsets = array('q', [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    return job, b''.join(encoded), offsets
+
+
+def write_npz(result: Dict[str, Any], path: str, compress: bool = False) -> None:
+    """Save a scheduling result as a columnar .npz archive; the rows keep the order of solvedProcessesInfo."""
+    solved = result['solvedProcessesInfo']
+    table, order = solved.table, solved.order
+    gantt = result['ganttChartInfo']
+
+    job, dictionary_data, dictionary_offsets = _dictionary(table.names[pid] for pid in order)
+    row = array('q', bytes(8 * len(table)))  # pid -> row
+    for index, pid in enumerate(order):
+        row[pid] = index
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED) as archive:
+        _write_member(archive, 'job', '<i8', job)
+        for name in ('at', 'bt', 'priority', 'ft', 'tat', 'wat'):
+            column = getattr(table, name)
+            if column is not None:
+                _write_member(archive, name, '<i8', _take(column, order))
+        _write_member(archive, 'job_dictionary_data', '|u1', dictionary_data)
+        _write_member(archive, 'job_dictionary_offsets', '<i8', dictionary_offsets)
+        _write_member(archive, 'gantt_row', '<i8', array('q', map(row.__getitem__, gantt.jobs)))
+        _write_member(archive, 'gantt_start', '<i8', _take(gantt.starts, range(len(gantt))))
+        _write_member(archive, 'gantt_stop', '<i8', _take(gantt.stops, range(len(gantt))))
+
+
+def read_npz(path: str) -> Dict[str, Any]:
+    """Load an archive written by write_npz back into the solvedProcessesInfo / ganttChartInfo shape."""
+    with zipfile.ZipFile(path) as archive:
+        members = {name[:-len('.npy')] for name in archive.namelist()}
+        columns = {name: _read_member(archive, name) for name in members}
+
+    data, offsets = columns['job_dictionary_data'], columns['job_dictionary_offsets']
+    dictionary = [data[offsets[i]:offsets[i + 1]].decode() for i in range(len(offsets) - 1)]
+    names = [dictionary[code] for code in columns['job']]
+
+    table = ProcessTable.from_columns(columns['at'], columns['bt'], names, columns.get('priority'),
+                                      columns['ft'], columns['tat'], columns['wat'])
+    return {
+        'solvedProcessesInfo': table.view(range(len(table))),
+        'ganttChartInfo': GanttChart.from_columns(names, columns['gantt_row'], columns['gantt_start'],
+                                                  columns['gantt_stop']),
+    }
+
+
+def write_solved_csv(solved: ProcessView, f: TextIO) -> None:
+    """Write solvedProcessesInfo as CSV straight from the table columns, without building the record dicts."""
+    table = solved.table
+    names, at, bt, priority, ft, tat, wat = (table.names, table.at, table.bt, table.priority,
+                                             table.ft, table.tat, table.wat)
+    writer = csv.writer(f)
+    writer.writerow(SOLVED_COLUMNS)
+    writer.writerows(
+        (names[pid], at[pid], bt[pid], priority[pid] if priority is not None else '', ft[pid], tat[pid], wat[pid])
+        for pid in solved.order
+    )
+
+
+def write_gantt_csv(gantt: GanttChart, f: TextIO) -> None:
+    names = gantt.names
+    writer = csv.writer(f)
+    writer.writerow(GANTT_COLUMNS)
+    writer.writerows((names[job], start, stop) for job, start, stop in gantt.segments())
+
+
+def write_stream_csv(pairs: Iterable[Tuple[str, Dict[str, Any]]], solved_file: TextIO,
+                     gantt_file: Optional[TextIO] = None) -> None:
+    """Write the ('gantt', segment) / ('solved', record) pairs of an iter_* scheduler as they are produced.
+
+    Processes are written in completion order; nothing but the current pair is kept in memory.
+    """
+    solved_writer = csv.DictWriter(solved_file, fieldnames=SOLVED_COLUMNS, extrasaction='ignore')
+    solved_writer.writeheader()
+    gantt_writer = None
+    if gantt_file is not None:
+        gantt_writer = csv.DictWriter(gantt_file, fieldnames=GANTT_COLUMNS)
+        gantt_writer.writeheader()
+
+    for kind, item in pairs:
+        if kind == 'solved':
+            solved_writer.writerow(item)
+        elif gantt_writer is not None:
+            gantt_writer.writerow(item)
@@ -0,0 +1,73 @@
+from array import array
+from typing import Dict, Any, Iterator, List, Sequence, Tuple
+
+class GanttChart:
+    """Run-length Gantt chart stored as parallel integer arrays of job index, start and stop."""
+
+    __slots__ = ('names', 'jobs', 'starts', 'stops')
+
+    def __init__(self, names: Sequence[str]):
+        self.names = names  # Job names, looked up by job index when a segment is viewed
+        self.jobs = array('q')
+        self.starts = array('q')
+        self.stops = array('q')
+
+    @classmethod
+    def from_columns(cls, names: Sequence[str], jobs: Sequence[int], starts: Sequence[int], stops: Sequence[int]) -> 'GanttChart':
+        """Wrap already computed segment columns (e.g. NumPy arrays) without copying them."""
+        gantt = cls(names)
+        gantt.jobs = jobs
+        gantt.starts = starts
+        gantt.stops = stops
+        return gantt
+
+    def append(self, job: int, start: int, stop: int) -> None:
+        """Record that job ran from start to stop, merging with the previous segment when contiguous."""
+        if self.jobs and self.jobs[-1] == job and self.stops[-1] == start:
+            self.stops[-1] = stop
+            return
+        self.jobs.append(job)
+        self.starts.append(start)
+        self.stops.append(stop)
+
+    def segments(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate over (job index, start, stop) tuples without building dicts."""
+        return zip(self.jobs, self.starts, self.stops)
+
+    def lanes(self) -> Dict[str, List[Tuple[int, int]]]:
+        """Group segments into one lane per job name, as (start, duration) pairs ready for broken_barh.
+
+        Lanes are ordered by the first time each job runs.
+        """
+        names = self.names
+        lanes: Dict[str, List[Tuple[int, int]]] = {}
+        for job, start, stop in self.segments():
+            name = names[job]
+            lane = lanes.get(name)
+            if lane is None:
+                lane = lanes[name] = []
+            lane.append((start, stop - start))
+        return lanes
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            'job': self.names[self.jobs[index]],
+            'start': self.starts[index],
+            'stop': self.stops[index],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = self.names
+        for job, start, stop in self.segments():
+            yield {'job': names[job], 'start': start, 'stop': stop}
+
+    def __repr__(self) -> str:
+        return f"GanttChart({self.to_list()!r})"
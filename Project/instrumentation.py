@@ -0,0 +1,66 @@
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Optional
+
+COUNTERS = ('dispatches', 'preemptions', 'queue_pushes', 'queue_pops', 'comparisons')
+
+
+class SchedulerStats:
+    """Opt-in counters, per-phase timers and optional tracemalloc peaks for one scheduling run.
+
+    Engines keep their counters in local variables and add them here once the run is over,
+    so passing no stats object costs nothing inside the scheduling loops. 'comparisons'
+    counts the preemption checks an engine makes, not the comparisons done inside heapq.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.phase_seconds: Dict[str, float] = {}
+        self.phase_peak_bytes: Dict[str, int] = {}
+
+    def count(self, **amounts: int) -> None:
+        for counter, amount in amounts.items():
+            self.counters[counter] += amount
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a phase; with trace_memory also record the peak memory allocated during it."""
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - start
+            if self.trace_memory:
+                self.phase_peak_bytes[name] = tracemalloc.get_traced_memory()[1] - baseline
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def report(self) -> Dict[str, Any]:
+        report = {'counters': dict(self.counters), 'phase_seconds': dict(self.phase_seconds)}
+        if self.trace_memory:
+            report['phase_peak_bytes'] = dict(self.phase_peak_bytes)
+        return report
+
+
+def phase(stats: Optional[SchedulerStats], name: str):
+    """stats.phase(name), or a no-op context when instrumentation is disabled."""
+    return stats.phase(name) if stats is not None else nullcontext()
+
+
+def attach(stats: Optional[SchedulerStats], result: Dict[str, Any], metrics=None) -> Dict[str, Any]:
+    """Add the stats report, and the metrics report when metrics were gathered, to a scheduling result."""
+    if stats is not None:
+        result['stats'] = stats.report()
+    if metrics is not None:
+        result['metrics'] = metrics.report()
+    return result
@@ -0,0 +1,180 @@
+import math
+from typing import Dict, Any, Iterable, Iterator
+
+from process_table import ProcessTable
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+QUANTILES = (0.5, 0.95, 0.99)
+INDEX_TABLE_SIZE = 4096  # Bucket indices of the values below this are looked up instead of computed
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch over non-negative values with log-spaced buckets (as in DDSketch).
+
+    A value x > 0 is counted in bucket ceil(log(x) / log(gamma)), gamma = (1 + a) / (1 - a), so
+    every quantile is within relative accuracy a of an actual value and the number of buckets
+    grows with log(max / min), not with the number of values. Zeros have their own bucket.
+    """
+
+    __slots__ = ('relative_accuracy', '_multiplier', '_gamma', '_index_table', 'buckets', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        # Index None is the bucket of zeros
+        self._index_table = [None] + [math.ceil(math.log(x) * self._multiplier) for x in range(1, INDEX_TABLE_SIZE)]
+        self.buckets: Dict[Any, int] = {}
+        self.total = 0
+        self.min = math.inf  # Exact extremes; infinite while the sketch is empty
+        self.max = -math.inf
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    @property
+    def zeros(self) -> int:
+        return self.buckets.get(None, 0)
+
+    def add(self, value: int) -> None:
+        if value < INDEX_TABLE_SIZE:
+            if value < 0:
+                raise ValueError("QuantileSketch only accepts non-negative values.")
+            index = self._index_table[value]
+        else:
+            index = math.ceil(math.log(value) * self._multiplier)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if value < self.min:
+            self.min = value
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add the values counted by other, e.g. the sketch of another run or worker."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def mean(self) -> float:
+        count = self.count
+        return self.total / count if count else 0
+
+    def quantile(self, q: float) -> float:
+        """Estimate of the q-quantile (0 <= q <= 1); exact for the minimum and the maximum."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        count = self.count
+        if not count:
+            return 0
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        for index in sorted(index for index in self.buckets if index is not None):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i], clamped to the values seen
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        summary = {'mean': self.mean()}
+        for q in QUANTILES:
+            summary[f'p{round(q * 100)}'] = self.quantile(q)
+        summary['max'] = self.max if self.buckets else 0
+        return summary
+
+
+class Metrics:
+    """Schedule metrics gathered from the engine events in the same pass that fills the results.
+
+    Turnaround, waiting and response time (first dispatch minus arrival) go into quantile
+    sketches; busy time, the schedule span and context switches are running counters. While
+    every event finishes its process (the non-preemptive engines), each event is a first
+    dispatch and nothing is kept per process; from the first preempted slice on, one byte per
+    process marks the ones already dispatched. Engines run one process at a time, so this is
+    for single-CPU schedules.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.turnaround = QuantileSketch(relative_accuracy)
+        self.waiting = QuantileSketch(relative_accuracy)
+        self.response = QuantileSketch(relative_accuracy)
+        self.busy_time = 0
+        self.first_start = None
+        self.last_stop = None
+        self.last_pid = None
+        self.context_switches = 0
+
+    def watch(self, processes: ProcessTable, events: Iterable[Any]) -> Iterator[Any]:
+        """Pass engine events through, updating the metrics with each of them.
+
+        Watching several event streams in turn (e.g. a replayed start and a resumed engine)
+        accumulates them as one schedule.
+        """
+        at, bt = processes.at, processes.bt
+        dispatched = None  # Allocated at the first slice that does not finish its process
+        add_turnaround, add_waiting, add_response = self.turnaround.add, self.waiting.add, self.response.add
+        busy_time = context_switches = 0
+        last_pid, last_stop = self.last_pid, None
+        try:
+            for event in events:
+                pid, start, stop, finished = event
+                if last_pid is None:
+                    if self.first_start is None:
+                        self.first_start = start
+                elif pid != last_pid:
+                    # Dispatching a different process than the one that ran last
+                    context_switches += 1
+                last_pid, last_stop = pid, stop
+                busy_time += stop - start
+                if dispatched is None:
+                    # No process has been preempted yet, so this one has not run before
+                    add_response(start - at[pid])
+                    if not finished:
+                        dispatched = bytearray(len(processes))
+                        dispatched[pid] = 1
+                elif not dispatched[pid]:
+                    dispatched[pid] = 1
+                    add_response(start - at[pid])
+                if finished:
+                    tat = stop - at[pid]
+                    add_turnaround(tat)
+                    add_waiting(tat - bt[pid])
+                yield event
+        finally:
+            # Counters are kept in locals inside the loop and stored once, even if the run is cancelled
+            self.busy_time += busy_time
+            self.context_switches += context_switches
+            if last_stop is not None:
+                self.last_stop = last_stop
+            self.last_pid = last_pid
+
+    def report(self) -> Dict[str, Any]:
+        span = self.last_stop - self.first_start if self.first_start is not None else 0
+        return {
+            'processes': self.turnaround.count,
+            'turnaroundTime': self.turnaround.summary(),
+            'waitingTime': self.waiting.summary(),
+            'responseTime': self.response.summary(),
+            'makespan': span,
+            'busyTime': self.busy_time,
+            'idleTime': span - self.busy_time,
+            'utilization': self.busy_time / span if span else 0,
+            'throughput': self.turnaround.count / span if span else 0,
+            'contextSwitches': self.context_switches,
+        }
@@ -0,0 +1,168 @@
+from collections import deque
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple, Union
+
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
+
+DEFAULT_LEVELS = 3          # Levels built from a single quantum q: q, 2q, 4q, ...
+DEFAULT_BOOST_FACTOR = 10   # Default boost interval, in multiples of the longest quantum
+
+
+def level_quanta(time_quantum: Union[int, Sequence[int]]) -> Tuple[int, ...]:
+    """Per-level quanta, top level first; a single quantum q expands to (q, 2q, 4q)."""
+    if isinstance(time_quantum, int):
+        quanta = tuple(time_quantum << level for level in range(DEFAULT_LEVELS))
+    else:
+        quanta = tuple(time_quantum)
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("Time quanta must be positive integers.")
+    return quanta
+
+
+class MLFQScheduler:
+    """Multi-level feedback queue built on the Round Robin engine's deque and arrival cursor.
+
+    New processes enter the top level. Each level is a FIFO deque served round robin with its
+    own quantum; using a whole quantum demotes a process one level, down to the last. A process
+    below the top level is preempted by the next arrival and goes back to the head of its
+    queue. Every boost_interval time units all waiting processes move back to the top level.
+    """
+
+    def __init__(self, arrival_time: List[int], burst_time: List[int], time_quantum: Union[int, Sequence[int]],
+                 process_names: List[str], boost_interval: Optional[int] = None,
+                 stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+                 metrics: Optional[Metrics] = None):
+        self.quanta = level_quanta(time_quantum)
+        if boost_interval is None:
+            boost_interval = DEFAULT_BOOST_FACTOR * max(self.quanta)
+        elif boost_interval < 0:
+            raise ValueError("Boost interval must be a non-negative integer (0 disables boosting).")
+        self.boost_interval = boost_interval  # 0 disables boosting
+        self.stats = stats
+        self.progress = progress
+        self.metrics = metrics
+        self.level_time = [0] * len(self.quanta)  # CPU time spent at each level, filled by events()
+        self.demotions = 0
+        self.preemptions = 0
+        self.boosts = 0
+        with phase(stats, 'build'):
+            self.processes_info = ProcessTable(arrival_time, burst_time, process_names)
+
+    def events(self) -> Iterator[Event]:
+        processes, quanta = self.processes_info, self.quanta
+        at = processes.at
+        arrival_order = processes.sorted_ids(at)
+
+        # One deque of process ids per level; a process's level is the queue it sits in
+        queues = [deque() for _ in quanta]
+        top, bottom = queues[0], len(quanta) - 1
+        next_arrival = 0  # Index of the first process not yet admitted to the top level
+        current_time = 0
+        n = len(processes)
+        finished = 0
+        next_boost = self.boost_interval or None
+        dispatches = preemptions = demotions = boosts = 0  # Reported once the run is over
+        level_time = self.level_time
+
+        remaining_time = processes.bt.tolist()
+
+        while finished < n:
+            # Admit every process that has arrived by current_time to the top level
+            while next_arrival < n and at[arrival_order[next_arrival]] <= current_time:
+                top.append(arrival_order[next_arrival])
+                next_arrival += 1
+
+            if next_boost is not None and current_time >= next_boost:
+                # Priority boost: move the lower levels, in level order, behind the top level
+                for queue in queues[1:]:
+                    top.extend(queue)
+                    queue.clear()
+                boosts += 1
+                next_boost += self.boost_interval * ((current_time - next_boost) // self.boost_interval + 1)
+
+            # Serve the highest non-empty level; there are only a few levels to look at
+            level = next((level for level, queue in enumerate(queues) if queue), None)
+            if level is None:
+                # Every queue is empty, move time forward to the next process arrival
+                current_time = at[arrival_order[next_arrival]]
+                continue
+
+            pid = queues[level].popleft()
+            dispatches += 1
+            stop = current_time + min(remaining_time[pid], quanta[level])
+
+            # Below the top level, the next arrival preempts the slice
+            preempted = False
+            if level > 0 and next_arrival < n and at[arrival_order[next_arrival]] < stop:
+                stop = at[arrival_order[next_arrival]]
+                preempted = True
+
+            start_time = current_time
+            remaining_time[pid] -= stop - start_time
+            level_time[level] += stop - start_time
+            current_time = stop
+
+            if remaining_time[pid] == 0:
+                finished += 1
+                yield pid, start_time, stop, True
+                continue
+
+            if preempted:
+                preemptions += 1
+                queues[level].appendleft(pid)  # Keeps its place and level
+            else:
+                # The whole quantum was used: demote, except at the bottom level
+                if level < bottom:
+                    level += 1
+                    demotions += 1
+                queues[level].append(pid)
+            yield pid, start_time, stop, False
+
+        self.demotions = demotions
+        self.preemptions = preemptions
+        self.boosts = boosts
+        if self.stats is not None:
+            requeues = dispatches - n
+            self.stats.count(dispatches=dispatches, preemptions=requeues, queue_pushes=n + requeues,
+                             queue_pops=dispatches)
+
+    def schedule(self) -> Dict[str, Any]:
+        with phase(self.stats, 'schedule'):
+            gantt_chart_info = collect(self.processes_info, self.events(), self.progress, metrics=self.metrics)
+
+        # Sort the processes by arrival time and then by job name
+        with phase(self.stats, 'results'):
+            solved_processes_info = self.processes_info.view()
+
+        return attach(self.stats, {
+            'solvedProcessesInfo': solved_processes_info,
+            'ganttChartInfo': gantt_chart_info,
+            'mlfqInfo': {
+                'quanta': list(self.quanta),
+                'boostInterval': self.boost_interval,
+                'levelTime': list(self.level_time),
+                'demotions': self.demotions,
+                'preemptions': self.preemptions,
+                'boosts': self.boosts,
+            },
+        }, self.metrics)
+
+    def iter_schedule(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ('gantt', segment) and ('solved', record) pairs as the schedule is produced."""
+        return stream(self.processes_info, self.events())
+
+
+def mlfq(arrival_time: List[int], burst_time: List[int], time_quantum: Union[int, Sequence[int]],
+         process_names: List[str], boost_interval: Optional[int] = None,
+         stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+         metrics: Optional[Metrics] = None) -> Dict[str, Any]:
+    return MLFQScheduler(arrival_time, burst_time, time_quantum, process_names, boost_interval,
+                         stats, progress, metrics).schedule()
+
+
+def iter_mlfq(arrival_time: List[int], burst_time: List[int], time_quantum: Union[int, Sequence[int]],
+              process_names: List[str], boost_interval: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    return MLFQScheduler(arrival_time, burst_time, time_quantum, process_names, boost_interval).iter_schedule()
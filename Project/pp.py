@@ -1,71 +1,103 @@
-from typing import List, Dict, Any
-
-def pp(arrival_time: List[int], burst_time: List[int], priorities: List[int], process_names: List[str]) -> Dict[str, Any]:
-    processes_info = [
-        {
-            'job': process_names[index],  # Use the provided process name
-            'at': item,
-            'bt': burst_time[index],
-            'priority': priorities[index],
-        }
-        for index, item in enumerate(arrival_time)
-    ]
+import heapq
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
-    # Sort processes based on arrival time and priority
-    processes_info.sort(key=lambda x: (x['at'], x['priority']))
+from aging import aging_ratio
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
+
+def pp_events(processes: ProcessTable, stats: Optional[SchedulerStats] = None, aging: float = 0) -> Iterator[Event]:
+    """With aging, a waiting process's priority improves (decreases) by aging per time unit it has waited."""
+    rate, scale = aging_ratio(aging)
+    at, priority = processes.at, processes.priority
 
-    solved_processes_info = []
-    gantt_chart_info = []
+    # Sort processes based on arrival time and priority
+    arrival_order = processes.sorted_ids(at, priority)
 
+    # Min-heap of arrived jobs keyed by (priority, at); the position in arrival_order breaks ties.
+    # With aging = rate / scale the key is scale times the priority minus aging times the time
+    # already waited plus aging times the time the job was queued, an exact integer: at any time t,
+    # key - rate * t is the job's aged priority times scale, so the waiting jobs keep their order
+    # and no key needs updating. The running job does not age, and aged priorities are only
+    # compared when a job arrives or finishes, so aging adds no scheduling points.
     ready_queue = []
+    next_arrival = 0  # Index of the first process not yet pushed to the ready queue
     current_time = 0
-    unfinished_jobs = processes_info.copy()
+    n = len(processes)
+    finished = 0
+    dispatches = preemptions = comparisons = 0  # Reported to stats once the run is over
 
-    remaining_time = {process['job']: process['bt'] for process in processes_info}
-
-    while unfinished_jobs:
-        # Add processes that have arrived by current_time to the ready queue
-        for process in unfinished_jobs:
-            if process['at'] <= current_time and process not in ready_queue:
-                ready_queue.append(process)
+    remaining_time = processes.bt.tolist()
 
+    while finished < n:
         if not ready_queue:
             # If no process is ready, move time forward to the next process arrival
-            current_time = min(process['at'] for process in unfinished_jobs)
-            continue
+            current_time = max(current_time, at[arrival_order[next_arrival]])
 
-        # Sort the ready queue by priority (and FCFS for equal priority)
-        ready_queue.sort(key=lambda x: (x['priority'], x['at']))
+        # Add processes that have arrived by current_time to the ready queue
+        while next_arrival < n and at[arrival_order[next_arrival]] <= current_time:
+            pid = arrival_order[next_arrival]
+            heapq.heappush(ready_queue, (priority[pid] * scale + rate * at[pid], at[pid], next_arrival))
+            next_arrival += 1
+
+        # Execute the process with the highest priority until it finishes or is preempted
+        key = heapq.heappop(ready_queue)
+        pid = arrival_order[key[2]]
+        start_time = current_time
+        dispatches += 1
+
+        while True:
+            finish_time = current_time + remaining_time[pid]
+            if next_arrival == n or at[arrival_order[next_arrival]] >= finish_time:
+                remaining_time[pid] = 0
+                current_time = finish_time
+                break
 
-        # Execute the process with the highest priority
-        process_to_execute = ready_queue[0]
-        gantt_chart_info.append({
-            'job': process_to_execute['job'],
-            'start': current_time,
-            'stop': current_time + 1,  # Execute for 1 time unit
-        })
+            # Run up to the next arrival and admit everything arriving at that instant
+            arrival = at[arrival_order[next_arrival]]
+            remaining_time[pid] -= arrival - current_time
+            current_time = arrival
+            while next_arrival < n and at[arrival_order[next_arrival]] == current_time:
+                new_pid = arrival_order[next_arrival]
+                heapq.heappush(ready_queue, (priority[new_pid] * scale + rate * at[new_pid], at[new_pid], next_arrival))
+                next_arrival += 1
 
-        # Decrement the remaining time for the executing process
-        remaining_time[process_to_execute['job']] -= 1
-        current_time += 1
+            # Preempt only if the head now has a strictly higher aged priority; the running
+            # job's key is the one it gets if it is queued again at current_time
+            comparisons += 1
+            running_key = (key[0] + rate * (current_time - start_time), key[1], key[2]) if rate else key
+            if ready_queue[0] < running_key:
+                heapq.heappush(ready_queue, running_key)
+                preemptions += 1
+                break
 
         # Check if the process is finished
-        if remaining_time[process_to_execute['job']] == 0:
-            # Remove the finished process from unfinished jobs
-            unfinished_jobs.remove(process_to_execute)
-            ready_queue.remove(process_to_execute)
-            solved_processes_info.append({
-                **process_to_execute,
-                'ft': current_time,
-                'tat': current_time - process_to_execute['at'],
-                'wat': (current_time - process_to_execute['at'] - process_to_execute['bt']),
-            })
+        if remaining_time[pid] == 0:
+            finished += 1
+            yield pid, start_time, current_time, True
         else:
-            # If not finished, keep it in the ready queue
-            ready_queue.remove(process_to_execute)
-            ready_queue.append(process_to_execute)
+            yield pid, start_time, current_time, False
+
+    if stats is not None:
+        stats.count(dispatches=dispatches, preemptions=preemptions, queue_pushes=n + preemptions,
+                    queue_pops=dispatches, comparisons=comparisons)
+
+def pp(arrival_time: List[int], burst_time: List[int], priorities: List[int], process_names: List[str],
+       stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+       metrics: Optional[Metrics] = None, aging: float = 0) -> Dict[str, Any]:
+    with phase(stats, 'build'):
+        processes = ProcessTable(arrival_time, burst_time, process_names, priorities)
+    with phase(stats, 'schedule'):
+        gantt_chart_info = collect(processes, pp_events(processes, stats, aging), progress, metrics=metrics)
 
     # Sort the processes by job name within arrival time
-    solved_processes_info.sort(key=lambda x: (x['at'], x['job']))
+    with phase(stats, 'results'):
+        solved_processes_info = processes.view()
+    return attach(stats, {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}, metrics)
 
-    return {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}
\ No newline at end of file
+def iter_pp(arrival_time: List[int], burst_time: List[int], priorities: List[int], process_names: List[str],
+            aging: float = 0) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    processes = ProcessTable(arrival_time, burst_time, process_names, priorities)
+    return stream(processes, pp_events(processes, aging=aging))
@@ -0,0 +1,153 @@
+from array import array
+from typing import Dict, Any, Iterator, List, Optional, Sequence
+
+# solvedProcessesInfo field -> ProcessTable column
+FIELD_COLUMNS = {'job': 'names', 'at': 'at', 'bt': 'bt', 'priority': 'priority', 'ft': 'ft', 'tat': 'tat', 'wat': 'wat'}
+
+def _total(column: Sequence[int]) -> int:
+    # NumPy columns sum natively; arrays and lists go through the builtin
+    return int(column.sum()) if hasattr(column, 'sum') else sum(column)
+
+class ProcessTable:
+    """Columnar process table; a process id is the position of the process in the input lists."""
+
+    __slots__ = ('names', 'at', 'bt', 'priority', 'ft', 'tat', 'wat', 'finished', 'total_tat', 'total_wat')
+
+    def __init__(self, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+                 priorities: Optional[Sequence[int]] = None):
+        n = len(arrival_time)
+        if len(burst_time) != n or len(process_names) != n:
+            raise ValueError("Arrival times, burst times and process names must have the same length.")
+        if priorities is not None and len(priorities) != n:
+            raise ValueError("Arrival times and priorities must have the same length.")
+
+        self.names = process_names
+        self.at = array('q', arrival_time)
+        self.bt = array('q', burst_time)
+        self.priority = array('q', priorities) if priorities is not None else None
+
+        # Result columns, filled in place by the schedulers
+        self.ft = array('q', bytes(8 * n))
+        self.tat = array('q', bytes(8 * n))
+        self.wat = array('q', bytes(8 * n))
+
+        # Running totals kept by finish(), so the summary needs no extra pass over the results
+        self.finished = 0
+        self.total_tat = 0
+        self.total_wat = 0
+
+    @classmethod
+    def from_columns(cls, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+                     priorities: Optional[Sequence[int]] = None, ft: Optional[Sequence[int]] = None,
+                     tat: Optional[Sequence[int]] = None, wat: Optional[Sequence[int]] = None) -> 'ProcessTable':
+        """Wrap existing column sequences (arrays, NumPy arrays, memory views) without copying them."""
+        n = len(arrival_time)
+        processes = cls.__new__(cls)
+        processes.names = process_names
+        processes.at = arrival_time
+        processes.bt = burst_time
+        processes.priority = priorities
+        processes.ft = ft if ft is not None else array('q', bytes(8 * n))
+        processes.tat = tat if tat is not None else array('q', bytes(8 * n))
+        processes.wat = wat if wat is not None else array('q', bytes(8 * n))
+        processes.finished = n if ft is not None else 0
+        processes.total_tat = _total(tat) if tat is not None else 0
+        processes.total_wat = _total(wat) if wat is not None else 0
+        return processes
+
+    def __len__(self) -> int:
+        return len(self.at)
+
+    def finish(self, pid: int, finish_time: int) -> None:
+        """Store the finish, turnaround and waiting time of a completed process."""
+        tat = finish_time - self.at[pid]
+        wat = tat - self.bt[pid]
+        self.ft[pid] = finish_time
+        self.tat[pid] = tat
+        self.wat[pid] = wat
+        self.finished += 1
+        self.total_tat += tat
+        self.total_wat += wat
+
+    def recount(self) -> None:
+        """Recompute the running totals from the result columns, after they were filled other than by finish()."""
+        self.finished = len(self)
+        self.total_tat = _total(self.tat)
+        self.total_wat = _total(self.wat)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the process count and average turnaround and waiting times of the finished processes."""
+        n = self.finished
+        return {
+            'processes': n,
+            'averageTurnaroundTime': self.total_tat / n if n else 0,
+            'averageWaitingTime': self.total_wat / n if n else 0,
+        }
+
+    def sorted_ids(self, *columns: Sequence[int], ids: Optional[List[int]] = None) -> List[int]:
+        """Return the process ids (all, or the given ones) sorted by the given columns (stable, so ties keep input order)."""
+        ids = list(range(len(self))) if ids is None else list(ids)
+        # Sorting by the least significant column first keeps the sort lexicographic
+        for column in reversed(columns):
+            ids.sort(key=column.__getitem__)
+        return ids
+
+    def record(self, pid: int) -> Dict[str, Any]:
+        """Build the solvedProcessesInfo dict of a single process."""
+        record = {'job': self.names[pid], 'at': self.at[pid], 'bt': self.bt[pid]}
+        if self.priority is not None:
+            record['priority'] = self.priority[pid]
+        record['ft'] = self.ft[pid]
+        record['tat'] = self.tat[pid]
+        record['wat'] = self.wat[pid]
+        return record
+
+    def view(self, order: Optional[Sequence[int]] = None) -> 'ProcessView':
+        """Return a lazy view of the records in the given order (by default sorted by job name within arrival time)."""
+        if order is None:
+            order = self.sorted_ids(self.at, self.names)
+        return ProcessView(self, order)
+
+    def result_view(self, algorithm: str) -> 'ProcessView':
+        """solvedProcessesInfo of an algorithm: FCFS in arrival order, the others by job name within arrival time."""
+        return self.view(self.sorted_ids(self.at)) if algorithm == 'fcfs' else self.view()
+
+
+class ProcessView:
+    """Read-only sequence of solvedProcessesInfo dicts, built on demand from a ProcessTable."""
+
+    __slots__ = ('table', 'order', '_sorted')
+
+    def __init__(self, table: ProcessTable, order: Sequence[int]):
+        self.table = table
+        self.order = order
+        self._sorted = {}  # field -> ProcessView sorted by that field, built on first use
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.record(pid) for pid in self.order[index]]
+        return self.table.record(self.order[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        record = self.table.record
+        for pid in self.order:
+            yield record(pid)
+
+    def __repr__(self) -> str:
+        return f"ProcessView({list(self)!r})"
+
+    def summary(self) -> Dict[str, Any]:
+        return self.table.summary()
+
+    def sorted_by(self, field: str) -> 'ProcessView':
+        """Return a view sorted by a solvedProcessesInfo field; ties keep this view's order and the result is cached."""
+        view = self._sorted.get(field)
+        if view is None:
+            column = getattr(self.table, FIELD_COLUMNS[field])
+            if column is None:
+                raise KeyError(field)
+            view = self._sorted[field] = ProcessView(self.table, sorted(self.order, key=column.__getitem__))
+        return view
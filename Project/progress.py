@@ -0,0 +1,41 @@
+import threading
+from typing import Iterable, Iterator, Tuple
+
+from process_table import ProcessTable
+
+CHECK_INTERVAL = 1024  # Engine events between two looks at the cancel flag
+
+
+class ScheduleCancelled(Exception):
+    """Raised out of a scheduling run whose Progress was cancelled."""
+
+
+class Progress:
+    """Progress and cancellation of one scheduling run, shared with the thread that watches it.
+
+    The run reports progress through the finished count its ProcessTable already keeps,
+    and only checks the cancel flag every CHECK_INTERVAL events.
+    """
+
+    def __init__(self):
+        self.processes = None  # The run's ProcessTable, set once scheduling starts
+        self.cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+    def fraction(self) -> float:
+        """Share of the processes finished so far, between 0 and 1."""
+        processes = self.processes
+        if processes is None or not len(processes):
+            return 0.0
+        return processes.finished / len(processes)
+
+    def watch(self, processes: ProcessTable, events: Iterable[Tuple[int, int, int, bool]]) -> Iterator[Tuple[int, int, int, bool]]:
+        """Pass engine events through, raising ScheduleCancelled once cancel() has been called."""
+        self.processes = processes
+        is_cancelled = self.cancelled.is_set
+        for count, event in enumerate(events):
+            if not count % CHECK_INTERVAL and is_cancelled():
+                raise ScheduleCancelled("Scheduling was cancelled.")
+            yield event
@@ -0,0 +1,115 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Sequence
+
+from process_table import ProcessView
+
+DEFAULT_ROW_HEIGHT = 20  # Treeview row height in pixels when the theme does not say
+
+
+class ResultsTable(tk.Frame):
+    """Treeview over a ProcessView that only holds the rows currently on screen.
+
+    The scrollbar is driven by hand, so scrolling or sorting touches one page of
+    rows no matter how many processes the view contains.
+    """
+
+    def __init__(self, master, rows: ProcessView, fields: Sequence[str], headings: Sequence[str], page_size: int = 20):
+        super().__init__(master)
+        self.rows = rows          # Default order, also the base of every sorted view
+        self.view = rows          # Order currently shown
+        self.fields = fields
+        self.headings = headings
+        self.sort_field = None
+        self.reverse = False
+        self.first = 0            # Position in self.view of the top visible row
+        self.page_size = page_size
+
+        style = ttk.Style(self)
+        self.row_height = int(style.lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+
+        self.tree = ttk.Treeview(self, columns=tuple(fields), show='headings', height=page_size)
+        for field, heading in zip(fields, headings):
+            self.tree.heading(field, text=heading, anchor="center", command=lambda f=field: self.sort(f))
+            self.tree.column(field, anchor="center")
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", self.on_mousewheel)
+        self.tree.bind("<Button-5>", self.on_mousewheel)
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.page_size))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.page_size))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(len(self.view)))
+
+        self.refresh()
+
+    def refresh(self):
+        """Show the page starting at self.first, reusing the existing Treeview items."""
+        n = len(self.view)
+        self.first = max(0, min(self.first, n - self.page_size))
+        visible = min(self.page_size, n - self.first)
+
+        items = self.tree.get_children()
+        for i in range(len(items), visible):
+            self.tree.insert("", "end", iid=str(i))
+        if len(items) > visible:
+            self.tree.delete(*items[visible:])
+
+        for i in range(visible):
+            index = self.first + i
+            if self.reverse:
+                index = n - 1 - index
+            record = self.view[index]
+            self.tree.item(str(i), values=tuple(record.get(field, "") for field in self.fields))
+
+        if n:
+            self.scrollbar.set(self.first / n, (self.first + visible) / n)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, first: int):
+        self.first = first
+        self.refresh()
+        return "break"
+
+    def scroll_by(self, rows: int):
+        return self.scroll_to(self.first + rows)
+
+    def on_scroll(self, action, amount, unit=None):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', count, 'units'/'pages')."""
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.view)))
+        else:
+            self.scroll_by(int(amount) * (self.page_size if unit == 'pages' else 1))
+
+    def on_mousewheel(self, event):
+        # X11 reports wheel motion as buttons 4/5, Windows and macOS as a signed delta
+        if event.num == 4 or event.delta > 0:
+            return self.scroll_by(-3)
+        return self.scroll_by(3)
+
+    def on_resize(self, event):
+        # The heading takes about one row of the Treeview's height
+        page_size = max(1, event.height // self.row_height - 1)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.refresh()
+
+    def sort(self, field: str):
+        """Sort by a column, toggling the direction when it is clicked again."""
+        if field == self.sort_field:
+            self.reverse = not self.reverse
+        else:
+            self.sort_field = field
+            self.reverse = False
+            self.view = self.rows.sorted_by(field)
+
+        for f, heading in zip(self.fields, self.headings):
+            arrow = (" ▼" if self.reverse else " ▲") if f == field else ""
+            self.tree.heading(f, text=heading + arrow)
+        self.scroll_to(0)
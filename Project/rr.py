@@ -1,78 +1,84 @@
-from typing import List, Dict, Any
+from collections import deque
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
-def rr(arrival_time: List[int], burst_time: List[int], time_quantum: int, process_names: List[str]) -> Dict[str, Any]:
-    processes_info = [
-        {
-            'job': process_names[index],  # Use the provided process name
-            'at': item,
-            'bt': burst_time[index],
-        }
-        for index, item in enumerate(arrival_time)
-    ]
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
 
-    # Sort processes based on arrival time
-    processes_info.sort(key=lambda x: x['at'])
+def rr_events(processes: ProcessTable, time_quantum: int, stats: Optional[SchedulerStats] = None,
+              arrival_order: Optional[List[int]] = None) -> Iterator[Event]:
+    # time_quantum must be positive; the public entry points validate it before the generator starts
+    at = processes.at
 
-    solved_processes_info = []
-    gantt_chart_info = []
+    # Sort processes based on arrival time, unless the caller already did (e.g. once for a whole sweep)
+    if arrival_order is None:
+        arrival_order = processes.sorted_ids(at)
 
-    ready_queue = []
+    # The ready queue holds process ids
+    ready_queue = deque()
+    next_arrival = 0  # Index of the first process not yet admitted to the ready queue
     current_time = 0  # Start at time 0
-    unfinished_jobs = processes_info.copy()
+    n = len(processes)
+    finished = 0
+    dispatches = 0  # Reported to stats once the run is over
 
-    remaining_time = {process['job']: process['bt'] for process in processes_info}
+    remaining_time = processes.bt.tolist()
 
-    while unfinished_jobs:
+    while finished < n:
         # Add processes to the ready queue that have arrived by current_time
-        for process in unfinished_jobs:
-            if process['at'] <= current_time and process not in ready_queue:
-                ready_queue.append(process)
+        while next_arrival < n and at[arrival_order[next_arrival]] <= current_time:
+            ready_queue.append(arrival_order[next_arrival])
+            next_arrival += 1
 
         if not ready_queue:
             # If the ready queue is empty, move time forward to the next process arrival
-            current_time = min(p['at'] for p in unfinished_jobs)
+            current_time = at[arrival_order[next_arrival]]
             continue  # Skip to the next iteration
 
-        process_to_execute = ready_queue[0]
-
-        if remaining_time[process_to_execute['job']] <= time_quantum:
-            # Execute until finished
-            remaining_t = remaining_time[process_to_execute['job']]
-            prev_current_time = current_time
-            current_time += remaining_t
-            gantt_chart_info.append({
-                'job': process_to_execute['job'],
-                'start': prev_current_time,
-                'stop': current_time,
-            })
-            remaining_time[process_to_execute['job']] = 0
-        else:
-            # Execute for the time quantum
-            remaining_time[process_to_execute['job']] -= time_quantum
-            prev_current_time = current_time
-            current_time += time_quantum
-            gantt_chart_info.append({
-                'job': process_to_execute['job'],
-                'start': prev_current_time,
-                'stop': current_time,
-            })
+        pid = ready_queue.popleft()
+        dispatches += 1
+
+        # Execute for the time quantum, or until finished if less remains
+        run_time = min(remaining_time[pid], time_quantum)
+        remaining_time[pid] -= run_time
+        prev_current_time = current_time
+        current_time += run_time
 
         # When the process finished executing
-        if remaining_time[process_to_execute['job']] == 0:
-            unfinished_jobs.remove(process_to_execute)
-            ready_queue.remove(process_to_execute)
-
-            solved_processes_info.append({
-                **process_to_execute,
-                'ft': current_time,
-                'tat': current_time - process_to_execute['at'],
-                'wat': current_time - process_to_execute['at'] - process_to_execute['bt'],
-            })
+        if remaining_time[pid] == 0:
+            finished += 1
+            yield pid, prev_current_time, current_time, True
         else:
             # Requeue the process if it still has remaining time
-            ready_queue.append(ready_queue.pop(0))  # Move the executed process to the end of the queue
+            ready_queue.append(pid)  # Move the executed process to the end of the queue
+            yield pid, prev_current_time, current_time, False
+
+    if stats is not None:
+        # Every dispatch that does not finish its process is a quantum expiry and a requeue
+        preemptions = dispatches - n
+        stats.count(dispatches=dispatches, preemptions=preemptions, queue_pushes=n + preemptions, queue_pops=dispatches)
+
+def rr(arrival_time: List[int], burst_time: List[int], time_quantum: int, process_names: List[str],
+       stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+       metrics: Optional[Metrics] = None) -> Dict[str, Any]:
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer.")
+
+    with phase(stats, 'build'):
+        processes = ProcessTable(arrival_time, burst_time, process_names)
+    with phase(stats, 'schedule'):
+        gantt_chart_info = collect(processes, rr_events(processes, time_quantum, stats), progress, metrics=metrics)
 
     # Sort the processes by arrival time and then by job name
-    solved_processes_info.sort(key=lambda x: (x['at'], x['job']))
+    with phase(stats, 'results'):
+        solved_processes_info = processes.view()
+    return attach(stats, {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}, metrics)
+
+def iter_rr(arrival_time: List[int], burst_time: List[int], time_quantum: int, process_names: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer.")
 
-    return {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}
\ No newline at end of file
+    processes = ProcessTable(arrival_time, burst_time, process_names)
+    return stream(processes, rr_events(processes, time_quantum))
@@ -1,91 +1,64 @@
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 
-def sjf(arrival_time: List[int], burst_time: List[int], process_names: List[str]) -> Dict[str, Any]:
-    processes_info = [
-        {
-            'job': process_names[index],  # Use the provided process name
-            'at': item,
-            'bt': burst_time[index],
-        }
-        for index, item in enumerate(arrival_time)
-    ]
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
 
-    # Sort processes based on arrival time and burst time
-    processes_info.sort(key=lambda x: (x['at'], x['bt']))
+def sjf_events(processes: ProcessTable, stats: Optional[SchedulerStats] = None, done: Optional[Set[int]] = None,
+               start_time: Optional[int] = None) -> Iterator[Event]:
+    at, bt = processes.at, processes.bt
 
-    finish_time = []
-    gantt_chart_info = []
+    # Sort processes based on arrival time and burst time; when resuming a schedule, only the processes not in done
+    pending = [pid for pid in range(len(processes)) if pid not in done] if done else None
+    arrival_order = processes.sorted_ids(at, bt, ids=pending)
 
-    solved_processes_info = []
+    # Min-heap of arrived jobs keyed by (bt, at); the position in arrival_order breaks ties
     ready_queue = []
-    finished_jobs = []
-
-    for i in range(len(processes_info)):
-        if i == 0:
-            ready_queue.append(processes_info[0])
-            finish_time.append(processes_info[0]['at'] + processes_info[0]['bt'])
-            solved_processes_info.append({
-                **processes_info[0],
-                'ft': finish_time[0],
-                'tat': finish_time[0] - processes_info[0]['at'],
-                'wat': finish_time[0] - processes_info[0]['at'] - processes_info[0]['bt'],
-            })
-
-            for p in processes_info:
-                if p['at'] <= finish_time[0] and p not in ready_queue:
-                    ready_queue.append(p)
-
-            ready_queue.pop(0)
-            finished_jobs.append(processes_info[0])
-
-            gantt_chart_info.append({
-                'job': processes_info[0]['job'],
-                'start': processes_info[0]['at'],
-                'stop': finish_time[0],
-            })
-        else:
-            if not ready_queue and len(finished_jobs) != len(processes_info):
-                unfinished_jobs = [p for p in processes_info if p not in finished_jobs]
-                unfinished_jobs.sort(key=lambda x: (x['at'], x['bt']))
-                ready_queue.append(unfinished_jobs[0])
-
-            rq_sorted_by_bt = sorted(ready_queue, key=lambda x: (x['bt'], x['at']))
-            process_to_execute = rq_sorted_by_bt[0]
-
-            previous_finish_time = finish_time[-1]
-
-            if process_to_execute['at'] > previous_finish_time:
-                finish_time.append(process_to_execute['at'] + process_to_execute['bt'])
-                newest_finish_time = finish_time[-1]
-                gantt_chart_info.append({
-                    'job': process_to_execute['job'],
-                    'start': process_to_execute['at'],
-                    'stop': newest_finish_time,
-                })
-            else:
-                finish_time.append(previous_finish_time + process_to_execute['bt'])
-                newest_finish_time = finish_time[-1]
-                gantt_chart_info.append({
-                    'job': process_to_execute['job'],
-                    'start': previous_finish_time,
-                    'stop': newest_finish_time,
-                })
-
-            solved_processes_info.append({
-                **process_to_execute,
-                'ft': newest_finish_time,
-                'tat': newest_finish_time - process_to_execute['at'],
-                'wat': newest_finish_time - process_to_execute['at'] - process_to_execute['bt'],
-            })
-
-            for p in processes_info:
-                if p['at'] <= newest_finish_time and p not in ready_queue and p not in finished_jobs:
-                    ready_queue.append(p)
-
-            ready_queue.remove(process_to_execute)
-            finished_jobs.append(process_to_execute)
+    next_arrival = 0  # Index of the first process not yet pushed to the ready queue
+    n = len(arrival_order)
+    if start_time is not None:
+        # A resumed schedule keeps the CPU busy until start_time
+        current_time = start_time
+    else:
+        current_time = at[arrival_order[0]] if n else 0
+
+    for _ in range(n):
+        if not ready_queue:
+            # CPU is idle, jump to the next arrival
+            current_time = max(current_time, at[arrival_order[next_arrival]])
+
+        # Push every process that has arrived by current_time
+        while next_arrival < n and at[arrival_order[next_arrival]] <= current_time:
+            pid = arrival_order[next_arrival]
+            heapq.heappush(ready_queue, (bt[pid], at[pid], next_arrival))
+            next_arrival += 1
+
+        pid = arrival_order[heapq.heappop(ready_queue)[2]]
+
+        start_time = current_time
+        current_time += bt[pid]
+        yield pid, start_time, current_time, True
+
+    if stats is not None:
+        # Non-preemptive: every process is pushed, popped and dispatched exactly once
+        stats.count(dispatches=n, queue_pushes=n, queue_pops=n)
+
+def sjf(arrival_time: List[int], burst_time: List[int], process_names: List[str],
+        stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+        metrics: Optional[Metrics] = None) -> Dict[str, Any]:
+    with phase(stats, 'build'):
+        processes = ProcessTable(arrival_time, burst_time, process_names)
+    with phase(stats, 'schedule'):
+        gantt_chart_info = collect(processes, sjf_events(processes, stats), progress, metrics=metrics)
 
     # Sort the processes by job name within arrival time
-    solved_processes_info.sort(key=lambda x: (x['at'], x['job']))
+    with phase(stats, 'results'):
+        solved_processes_info = processes.view()
+    return attach(stats, {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}, metrics)
 
-    return {'solvedProcessesInfo': solved_processes_info, 'ganttChartInfo': gantt_chart_info}
\ No newline at end of file
+def iter_sjf(arrival_time: List[int], burst_time: List[int], process_names: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    processes = ProcessTable(arrival_time, burst_time, process_names)
+    return stream(processes, sjf_events(processes))
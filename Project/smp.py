@@ -0,0 +1,272 @@
+"""Multiprocessor simulation: any scheduling policy over N cores with per-core ready queues.
+
+Example:
+    python smp.py --jobs 100000 --load 8 --policy srtf --cores 1,2,4,8,16,32
+"""
+import argparse
+import heapq
+import json
+import sys
+from collections import deque
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
+
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS
+from gantt import GanttChart
+from instrumentation import SchedulerStats, attach, phase
+from process_table import ProcessTable
+from progress import Progress
+
+POLICIES = ('fcfs', 'npp', 'pp', 'rr', 'sjf', 'srtf')
+PREEMPTIVE_POLICIES = ('pp', 'srtf')
+
+# (core, pid, start, stop, finished) for each uninterrupted run on one core
+CoreEvent = Tuple[int, int, int, int, bool]
+
+
+class SMPScheduler:
+    """Runs one policy over several simulated cores.
+
+    Every core has its own ready queue, ordered like the single-CPU scheduler of the policy.
+    An arriving process goes to the core with the fewest queued and running processes; a
+    core that runs out of work steals the head of the longest queue. Arrivals are admitted
+    at scheduling points (a slice ending, or any arrival while a core is idle or the policy
+    is preemptive), so with one core every policy reproduces its single-CPU schedule.
+    """
+
+    def __init__(self, arrival_time: List[int], burst_time: List[int], process_names: List[str], cores: int,
+                 policy: str = 'fcfs', priorities: Optional[List[int]] = None, time_quantum: Optional[int] = None,
+                 stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None):
+        if cores < 1:
+            raise ValueError("The number of cores must be a positive integer.")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown scheduling algorithm: {policy}")
+        if policy in PRIORITY_ALGORITHMS and priorities is None:
+            raise ValueError(f"{ALGORITHMS[policy][0]} requires priorities.")
+        if policy == 'rr' and (not isinstance(time_quantum, int) or time_quantum <= 0):
+            raise ValueError("Time quantum must be a positive integer.")
+
+        self.cores = cores
+        self.policy = policy
+        self.time_quantum = time_quantum
+        self.stats = stats
+        self.progress = progress
+        self.steals = 0  # Processes taken from another core's queue, counted by events()
+        with phase(stats, 'build'):
+            self.processes_info = ProcessTable(arrival_time, burst_time, process_names,
+                                               priorities if policy in PRIORITY_ALGORITHMS else None)
+
+    def events(self) -> Iterator[CoreEvent]:
+        processes, policy, cores = self.processes_info, self.policy, self.cores
+        at, bt, priority = processes.at, processes.bt, processes.priority
+        n = len(processes)
+
+        # Same arrival order, and so the same tie-breaking, as the single-CPU engines
+        if policy in ('sjf', 'srtf'):
+            arrival_order = processes.sorted_ids(at, bt)
+        elif policy in PRIORITY_ALGORITHMS:
+            arrival_order = processes.sorted_ids(at, priority)
+        else:
+            arrival_order = processes.sorted_ids(at)
+        position = [0] * n
+        for pos, pid in enumerate(arrival_order):
+            position[pid] = pos
+
+        remaining = bt.tolist()
+        round_robin = policy == 'rr'
+        preemptive = policy in PREEMPTIVE_POLICIES
+
+        def key(pid):
+            if policy in ('fcfs', 'rr'):
+                return position[pid]
+            if policy == 'sjf':
+                return bt[pid], at[pid], position[pid]
+            if policy == 'srtf':
+                return remaining[pid], at[pid], position[pid]
+            return priority[pid], at[pid], position[pid]
+
+        # Per-core state; rr queues are FIFO deques of pids, the others heaps of (key, pid)
+        queues = [deque() if round_robin else [] for _ in range(cores)]
+        running = [None] * cores   # pid on the core, or None when it is idle
+        started = [0] * cores      # Start of the running slice
+        version = [0] * cores      # Bumped on preemption so the pending slice end goes stale
+        slice_ends = []            # Heap of (time, core, version)
+        idle = cores
+
+        def push(core, pid):
+            if round_robin:
+                queues[core].append(pid)
+            else:
+                heapq.heappush(queues[core], (key(pid), pid))
+
+        def pop(core):
+            return queues[core].popleft() if round_robin else heapq.heappop(queues[core])[1]
+
+        next_arrival = 0
+        finished = 0
+        dispatches = preemptions = comparisons = steals = 0
+
+        while finished < n:
+            # Next scheduling point: a slice end, or an arrival if it can be acted on right away
+            now = slice_ends[0][0] if slice_ends else None
+            if next_arrival < n and (idle or preemptive):
+                arrival = at[arrival_order[next_arrival]]
+                if now is None or arrival < now:
+                    now = arrival
+
+            # End the slices finishing now; an rr process goes back to the tail of its core's queue
+            while slice_ends and slice_ends[0][0] == now:
+                _, core, slice_version = heapq.heappop(slice_ends)
+                if slice_version != version[core]:
+                    continue
+                pid = running[core]
+                remaining[pid] -= now - started[core]
+                running[core] = None
+                idle += 1
+                if remaining[pid] == 0:
+                    finished += 1
+                    yield core, pid, started[core], now, True
+                else:
+                    push(core, pid)
+                    yield core, pid, started[core], now, False
+
+            # Admit the arrivals up to now, each to the least loaded core
+            touched = set()
+            while next_arrival < n and at[arrival_order[next_arrival]] <= now:
+                pid = arrival_order[next_arrival]
+                next_arrival += 1
+                core = min(range(cores), key=lambda c: len(queues[c]) + (running[c] is not None))
+                push(core, pid)
+                touched.add(core)
+
+            # Preemptive policies: a newly queued process with a better key takes over the core
+            if preemptive:
+                for core in sorted(touched):
+                    pid = running[core]
+                    if pid is None:
+                        continue
+                    comparisons += 1
+                    ran = now - started[core]
+                    running_key = (remaining[pid] - ran, at[pid], position[pid]) if policy == 'srtf' else key(pid)
+                    if queues[core][0][0] < running_key:
+                        remaining[pid] -= ran
+                        version[core] += 1
+                        running[core] = None
+                        idle += 1
+                        preemptions += 1
+                        push(core, pid)
+                        yield core, pid, started[core], now, False
+
+            # Dispatch on every idle core from its own queue; cores still idle then steal the head of the longest queue
+            for stealing in (False, True):
+                for core in range(cores):
+                    if running[core] is not None:
+                        continue
+                    if stealing:
+                        victim = max(range(cores), key=lambda c: len(queues[c]))
+                        if not queues[victim]:
+                            break  # Nothing is waiting anywhere
+                        steals += 1
+                    elif queues[core]:
+                        victim = core
+                    else:
+                        continue
+                    pid = pop(victim)
+                    running[core] = pid
+                    started[core] = now
+                    idle -= 1
+                    dispatches += 1
+                    run_time = min(remaining[pid], self.time_quantum) if round_robin else remaining[pid]
+                    heapq.heappush(slice_ends, (now + run_time, core, version[core]))
+
+        self.steals = steals
+        if self.stats is not None:
+            # Every queued process is dispatched eventually, so pushes and pops both equal dispatches
+            self.stats.count(dispatches=dispatches, preemptions=preemptions, queue_pushes=dispatches,
+                             queue_pops=dispatches, comparisons=comparisons)
+
+    def schedule(self) -> Dict[str, Any]:
+        processes = self.processes_info
+        names = processes.names
+        merged = GanttChart(names)
+        core_charts = [GanttChart(names) for _ in range(self.cores)]
+        busy = [0] * self.cores
+
+        events = self.events()
+        if self.progress is not None:
+            events = self.progress.watch(processes, events)
+        with phase(self.stats, 'schedule'):
+            for core, pid, start, stop, finished in events:
+                core_charts[core].append(pid, start, stop)
+                merged.append(pid, start, stop)
+                busy[core] += stop - start
+                if finished:
+                    processes.finish(pid, stop)
+
+        with phase(self.stats, 'results'):
+            solved_processes_info = processes.result_view(self.policy)
+
+        makespan = max(processes.ft) - min(processes.at) if len(processes) else 0
+        return attach(self.stats, {
+            'solvedProcessesInfo': solved_processes_info,
+            'ganttChartInfo': merged,  # Segments of every core, in the order they ended
+            'coreGanttChartInfo': core_charts,
+            'smpInfo': {
+                'cores': self.cores,
+                'steals': self.steals,
+                'makespan': makespan,
+                'busyTime': busy,
+                'utilization': sum(busy) / (self.cores * makespan) if makespan else 0,
+            },
+        })
+
+
+def smp(arrival_time: List[int], burst_time: List[int], process_names: List[str], cores: int, policy: str = 'fcfs',
+        priorities: Optional[List[int]] = None, time_quantum: Optional[int] = None,
+        stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None) -> Dict[str, Any]:
+    return SMPScheduler(arrival_time, burst_time, process_names, cores, policy, priorities, time_quantum,
+                        stats, progress).schedule()
+
+
+def scaling(arrival_time: Sequence[int], burst_time: Sequence[int], core_counts: Sequence[int], policy: str = 'fcfs',
+            priorities: Optional[Sequence[int]] = None, time_quantum: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run one workload over several core counts and report waiting time, throughput and utilization for each."""
+    names = range(len(arrival_time))
+    rows = []
+    for cores in core_counts:
+        result = smp(arrival_time, burst_time, names, cores, policy, priorities, time_quantum)
+        summary = result['solvedProcessesInfo'].summary()
+        info = result['smpInfo']
+        rows.append({
+            'cores': cores,
+            'policy': policy,
+            'averageTurnaroundTime': summary['averageTurnaroundTime'],
+            'averageWaitingTime': summary['averageWaitingTime'],
+            'throughput': summary['processes'] / info['makespan'] if info['makespan'] else 0,
+            'utilization': info['utilization'],
+            'steals': info['steals'],
+        })
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from benchmark import generate_workload
+
+    parser = argparse.ArgumentParser(description="Waiting time and throughput of a policy as the core count grows.")
+    parser.add_argument('--policy', choices=POLICIES, default='fcfs')
+    parser.add_argument('--cores', default='1,2,4,8', help="comma-separated core counts (default: %(default)s)")
+    parser.add_argument('--jobs', type=int, default=10000, help="generated workload size")
+    parser.add_argument('--load', type=float, default=4.0, help="offered load, in single-CPU units")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quantum', type=int, default=4, help="Round Robin time quantum")
+    args = parser.parse_args(argv)
+
+    workload = generate_workload(args.jobs, seed=args.seed, load=args.load)
+    rows = scaling(workload['arrival_time'], workload['burst_time'], [int(c) for c in args.cores.split(',')],
+                   args.policy, workload['priorities'], args.quantum)
+    json.dump(rows, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,137 +1,106 @@
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from gantt import GanttChart
+from instrumentation import SchedulerStats, attach, phase
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import Event, collect, stream
+
+def srtf_events(processes: ProcessTable, stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+    at = processes.at
+    arrival_order = processes.sorted_ids(at, processes.bt)
+
+    # Min-heap of arrived jobs keyed by (remaining time, at); the position in arrival_order breaks ties
+    ready_queue = []
+    next_arrival = 0  # Index of the first process not yet pushed to the ready queue
+    n = len(processes)
+    current_time = at[arrival_order[0]] if n else 0
+    finished = 0
+    dispatches = preemptions = comparisons = 0  # Reported to stats once the run is over
+
+    while finished < n:
+        if not ready_queue:
+            # CPU is idle, jump to the next arrival
+            current_time = max(current_time, at[arrival_order[next_arrival]])
+
+        # Push every process that has arrived by current_time
+        while next_arrival < n and at[arrival_order[next_arrival]] <= current_time:
+            pid = arrival_order[next_arrival]
+            heapq.heappush(ready_queue, (processes.bt[pid], at[pid], next_arrival))
+            next_arrival += 1
+
+        remaining_t, arrival, position = heapq.heappop(ready_queue)
+        pid = arrival_order[position]
+        start_time = current_time
+        dispatches += 1
+
+        # Run until completion; preemption is only possible when a new process arrives
+        while True:
+            finish_time = current_time + remaining_t
+            if next_arrival == n or at[arrival_order[next_arrival]] >= finish_time:
+                remaining_t = 0
+                current_time = finish_time
+                break
+
+            next_at = at[arrival_order[next_arrival]]
+            remaining_t -= next_at - current_time
+            current_time = next_at
+            while next_arrival < n and at[arrival_order[next_arrival]] == current_time:
+                new_pid = arrival_order[next_arrival]
+                heapq.heappush(ready_queue, (processes.bt[new_pid], at[new_pid], next_arrival))
+                next_arrival += 1
+
+            comparisons += 1
+            if ready_queue[0] < (remaining_t, arrival, position):
+                heapq.heappush(ready_queue, (remaining_t, arrival, position))
+                preemptions += 1
+                break
+
+        # When the process finished executing
+        if remaining_t == 0:
+            finished += 1
+            yield pid, start_time, current_time, True
+        else:
+            yield pid, start_time, current_time, False
+
+    if stats is not None:
+        stats.count(dispatches=dispatches, preemptions=preemptions, queue_pushes=n + preemptions,
+                    queue_pops=dispatches, comparisons=comparisons)
 
 class SRTFScheduler:
-    def __init__(self, arrival_time: List[int], burst_time: List[int], process_names: List[str]):
+    def __init__(self, arrival_time: List[int], burst_time: List[int], process_names: List[str],
+                 stats: Optional[SchedulerStats] = None, progress: Optional[Progress] = None,
+                 metrics: Optional[Metrics] = None):
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.process_names = process_names  # Store the process names
-        self.processes_info = self.initialize_processes()
+        self.stats = stats  # Optional instrumentation, reported as result['stats']
+        self.progress = progress  # Optional progress reporting and cancellation
+        self.metrics = metrics  # Optional percentiles, utilization and context switches, reported as result['metrics']
+        with phase(stats, 'build'):
+            self.processes_info = self.initialize_processes()
         self.solved_processes_info = []
-        self.gantt_chart_info = []
-
-    def initialize_processes(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'job': self.process_names[index],  # Use the provided process name
-                'at': item,
-                'bt': self.burst_time[index]
-            }
-            for index, item in enumerate(self.arrival_time)
-        ]
+        self.gantt_chart_info = GanttChart(self.processes_info.names)
+
+    def initialize_processes(self) -> ProcessTable:
+        return ProcessTable(self.arrival_time, self.burst_time, self.process_names)
 
     def schedule(self) -> Dict[str, Any]:
-        self.processes_info.sort(key=lambda x: (x['at'], x['bt']))
-
-        ready_queue = []
-        current_time = self.processes_info[0]['at']
-        unfinished_jobs = self.processes_info.copy()
-
-        remaining_time = {process['job']: process['bt'] for process in self.processes_info}
-
-        ready_queue.append(unfinished_jobs[0])
-        while sum(remaining_time.values()) > 0 and unfinished_jobs:
-            prev_idle = False
-            if not ready_queue and unfinished_jobs:
-                prev_idle = True
-                ready_queue.append(unfinished_jobs[0])
-
-            ready_queue.sort(key=lambda x: (remaining_time[x['job']], x['at']))
-
-            process_to_execute = ready_queue[0]
-
-            process_at_less_than_bt = [
-                p for p in self.processes_info
-                if p['at'] <= remaining_time[process_to_execute['job']] + current_time
-                and p != process_to_execute
-                and p not in ready_queue
-                and p in unfinished_jobs
-            ]
-
-            got_interruption = False
-            for p in process_at_less_than_bt:
-                if prev_idle:
-                    current_time = process_to_execute['at']
-
-                amount = p['at'] - current_time
-
-                if current_time >= p['at']:
-                    ready_queue.append(p)
-
-                if p['bt'] < remaining_time[process_to_execute['job']] - amount:
-                    remaining_time[process_to_execute['job']] -= amount
-                    ready_queue.append(p)
-                    prev_current_time = current_time
-                    current_time += amount
-                    self.gantt_chart_info.append({
-                        'job': process_to_execute['job'],
-                        'start': prev_current_time,
-                        'stop': current_time,
-                    })
-
-                    got_interruption = True
-                    break
-
-            process_to_arrive = [
-                p for p in self.processes_info
-                if p['at'] <= current_time
-                and p != process_to_execute
-                and p not in ready_queue
-                and p in unfinished_jobs
-            ]
-
-            # Push new processes to readyQueue
-            ready_queue.extend(process_to_arrive)
-
-            if not got_interruption:
-                if prev_idle:
-                    remaining_t = remaining_time[process_to_execute['job']]
-                    remaining_time[process_to_execute['job']] -= remaining_t
-                    current_time = process_to_execute['at'] + remaining_t
-
-                    for p in process_at_less_than_bt:
-                        if current_time >= p['at'] and p not in ready_queue:
-                            ready_queue.append(p)
-
-                    self.gantt_chart_info.append({
-                        'job': process_to_execute['job'],
-                        'start': process_to_execute['at'],
-                        'stop': current_time,
-                    })
-                else:
-                    remaining_t = remaining_time[process_to_execute['job']]
-                    remaining_time[process_to_execute['job']] -= remaining_t
-                    prev_current_time = current_time
-                    current_time += remaining_t
-
-                    for p in process_at_less_than_bt:
-                        if current_time >= p['at'] and p not in ready_queue:
-                            ready_queue.append(p)
-
-                    self.gantt_chart_info.append({
-                        'job': process_to_execute['job'],
-                        'start': prev_current_time,
-                        'stop': current_time,
-                    })
-
-            # Requeueing (move head/first item to tail/last)
-            ready_queue.append(ready_queue.pop(0))
-
-                        # When the process finished executing
-            if remaining_time[process_to_execute['job']] == 0:
-                unfinished_jobs.remove(process_to_execute)
-                ready_queue.remove(process_to_execute)
-
-                self.solved_processes_info.append({
-                    **process_to_execute,
-                    'ft': current_time,
-                    'tat': current_time - process_to_execute['at'],
-                    'wat': current_time - process_to_execute['at'] - process_to_execute['bt'],
-                })
+        with phase(self.stats, 'schedule'):
+            self.gantt_chart_info = collect(self.processes_info, srtf_events(self.processes_info, self.stats), self.progress,
+                                            metrics=self.metrics)
 
         # Sort the processes by job name within arrival time
-        self.solved_processes_info.sort(key=lambda x: (x['at'], x['job']))
+        with phase(self.stats, 'results'):
+            self.solved_processes_info = self.processes_info.view()
 
-        return {
+        return attach(self.stats, {
             'solvedProcessesInfo': self.solved_processes_info,
             'ganttChartInfo': self.gantt_chart_info
-        }
\ No newline at end of file
+        }, self.metrics)
+
+    def iter_schedule(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ('gantt', segment) and ('solved', record) pairs as the schedule is produced."""
+        return stream(self.processes_info, srtf_events(self.processes_info))
@@ -0,0 +1,60 @@
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from gantt import GanttChart
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+
+# Scheduler engines yield one (pid, start, stop, finished) tuple per uninterrupted run;
+# finished is True when the process completes at stop.
+Event = Tuple[int, int, int, bool]
+
+
+def collect(processes: ProcessTable, events: Iterable[Event], progress: Optional[Progress] = None,
+            gantt_chart_info: Optional[GanttChart] = None, metrics: Optional[Metrics] = None) -> GanttChart:
+    """Drain an engine into a GanttChart, filling the result columns of the process table.
+
+    Segments are appended to gantt_chart_info when given, which is how a resumed schedule
+    continues the chart of the schedule it resumes. metrics, when given, sees every event
+    in the same pass.
+    """
+    if metrics is not None:
+        events = metrics.watch(processes, events)
+    if progress is not None:
+        events = progress.watch(processes, events)
+    if gantt_chart_info is None:
+        gantt_chart_info = GanttChart(processes.names)
+    append = gantt_chart_info.append
+    finish = processes.finish
+    for pid, start, stop, finished in events:
+        append(pid, start, stop)
+        if finished:
+            finish(pid, stop)
+    return gantt_chart_info
+
+
+def stream(processes: ProcessTable, events: Iterable[Event]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Turn engine events into ('gantt', segment) and ('solved', record) pairs as they happen.
+
+    Contiguous runs of the same job are merged before being yielded, so at most one
+    segment is held back at any time.
+    """
+    names = processes.names
+    pending = None  # [pid, start, stop] of the segment not yet yielded
+
+    for pid, start, stop, finished in events:
+        if pending is not None and pending[0] == pid and pending[2] == start:
+            pending[2] = stop
+        else:
+            if pending is not None:
+                yield 'gantt', {'job': names[pending[0]], 'start': pending[1], 'stop': pending[2]}
+            pending = [pid, start, stop]
+
+        if finished:
+            yield 'gantt', {'job': names[pid], 'start': pending[1], 'stop': stop}
+            pending = None
+            processes.finish(pid, stop)
+            yield 'solved', processes.record(pid)
+
+    if pending is not None:
+        yield 'gantt', {'job': names[pending[0]], 'start': pending[1], 'stop': pending[2]}
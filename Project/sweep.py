@@ -0,0 +1,124 @@
+"""Round Robin time-quantum sweep: evaluate rr over many quanta on one workload.
+
+Example:
+    python sweep.py processes.csv --quanta 1:20 --output sweep.json
+"""
+import argparse
+import json
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence
+
+from cli import read_processes
+from process_table import ProcessTable
+from rr import rr_events
+
+# Set in each worker process by _init_worker, so the workload is sent once per worker, not once per quantum
+_processes = None
+_arrival_order = None
+
+
+def _init_worker(arrival_time: array, burst_time: array, arrival_order: array) -> None:
+    global _processes, _arrival_order
+    _processes = ProcessTable.from_columns(arrival_time, burst_time, range(len(arrival_time)))
+    _arrival_order = arrival_order
+
+
+def _evaluate(time_quantum: int) -> Dict[str, Any]:
+    """Run rr with one quantum on the worker's workload and reduce it to the sweep figures."""
+    at, bt = _processes.at, _processes.bt
+    slices = context_switches = 0
+    total_tat = 0
+    last_pid = None
+    for pid, start, stop, finished in rr_events(_processes, time_quantum, arrival_order=_arrival_order):
+        slices += 1
+        if pid != last_pid:
+            # Dispatching a different process than the one that ran last
+            if last_pid is not None:
+                context_switches += 1
+            last_pid = pid
+        if finished:
+            total_tat += stop - at[pid]
+
+    n = len(_processes)
+    total_wat = total_tat - sum(bt)
+    return {
+        'quantum': time_quantum,
+        'averageTurnaroundTime': total_tat / n if n else 0,
+        'averageWaitingTime': total_wat / n if n else 0,
+        'slices': slices,
+        'contextSwitches': context_switches,
+    }
+
+
+def sweep_quanta(arrival_time: Sequence[int], burst_time: Sequence[int], quanta: Sequence[int],
+                 max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Evaluate Round Robin for every quantum and return one row per quantum, in the given order.
+
+    The workload is converted and sorted by arrival once, handed to each worker process
+    through the pool initializer, and the quanta are spread over the workers. Each row has
+    the average turnaround and waiting times, the number of slices (dispatches) and the
+    number of context switches. max_workers=1 runs everything in this process.
+    """
+    if any(q <= 0 for q in quanta):
+        raise ValueError("Time quantum must be a positive integer.")
+    if len(burst_time) != len(arrival_time):
+        raise ValueError("Arrival times and burst times must have the same length.")
+
+    at = array('q', arrival_time)
+    bt = array('q', burst_time)
+    arrival_order = array('q', sorted(range(len(at)), key=at.__getitem__))
+
+    if max_workers == 1 or len(quanta) <= 1:
+        _init_worker(at, bt, arrival_order)
+        return [_evaluate(q) for q in quanta]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(at, bt, arrival_order)) as executor:
+        return list(executor.map(_evaluate, quanta))
+
+
+def parse_quanta(spec: str) -> List[int]:
+    """'1,2,4,8' lists quanta; 'start:stop[:step]' is an inclusive range."""
+    quanta = []
+    for part in spec.split(','):
+        if ':' in part:
+            start, stop, *step = (int(x) for x in part.split(':'))
+            quanta.extend(range(start, stop + 1, step[0] if step else 1))
+        else:
+            quanta.append(int(part))
+    return quanta
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare Round Robin time quanta on one workload.")
+    parser.add_argument('input', help="CSV or JSON file with name, arrival_time, burst_time; '-' for stdin")
+    parser.add_argument('--quanta', default='1:20', help="quanta as '1,2,4,8' or 'start:stop[:step]' (default: %(default)s)")
+    parser.add_argument('--input-format', choices=('csv', 'json'), help="default: guessed from the file extension")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('-o', '--output', help="write the JSON rows here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        processes = read_processes(args.input, args.input_format)
+        rows = sweep_quanta([p['arrival_time'] for p in processes], [p['burst_time'] for p in processes],
+                            parse_quanta(args.quanta), args.jobs)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for row in rows:
+        print(f"q={row['quantum']:>4}  TAT {row['averageTurnaroundTime']:10.2f}  WT {row['averageWaitingTime']:10.2f}  "
+              f"{row['slices']:>9} slices  {row['contextSwitches']:>9} switches", file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+    else:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+from fractions import Fraction
+
+# The scheduler modules sit flat in Project/ and import each other by name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Columns each heap-based algorithm sorts its arrival order by, and whether it preempts
+POLICIES = {
+    'fcfs': (('at',), False),
+    'sjf': (('at', 'bt'), False),
+    'npp': (('at', 'priority'), False),
+    'pp': (('at', 'priority'), True),
+    'srtf': (('at', 'bt'), True),
+}
+
+
+def workloads(seed, count, size=8, horizon=12, max_burst=7, max_priority=4):
+    """Random (arrival times, burst times, priorities) workloads of 1 to size processes."""
+    rnd = random.Random(seed)
+    for _ in range(count):
+        n = rnd.randint(1, size)
+        yield ([rnd.randint(0, horizon) for _ in range(n)], [rnd.randint(1, max_burst) for _ in range(n)],
+               [rnd.randint(0, max_priority) for _ in range(n)])
+
+
+def add_unit(segments, pid, t):
+    """Record that pid ran from t to t + 1, extending its segment if it also ran just before."""
+    if segments and segments[-1][0] == pid and segments[-1][2] == t:
+        segments[-1][2] += 1
+    else:
+        segments.append([pid, t, t + 1])
+
+
+def reference(algorithm, arrival_time, burst_time, priorities=None, aging=0):
+    """Unit-step simulation of a heap-based algorithm: finish times and merged (pid, start, stop) segments.
+
+    The ready process with the smallest (burst time, priority or remaining time; arrival time;
+    position in arrival order) key runs. A waiting process's aged priority is its priority
+    minus aging times the time it has spent waiting; the running process does not age. A
+    preemptive algorithm compares keys when a process arrives and switches only to a strictly
+    smaller one.
+    """
+    n = len(arrival_time)
+    columns = {'at': arrival_time, 'bt': burst_time, 'priority': priorities}
+    sort_columns, preemptive = POLICIES[algorithm]
+    order = sorted(range(n), key=lambda pid: tuple(columns[name][pid] for name in sort_columns))
+    position = {pid: pos for pos, pid in enumerate(order)}
+    aging = Fraction(str(aging)) if isinstance(aging, float) else Fraction(aging)
+    remaining = list(burst_time)
+    waited = [0] * n
+    queued_at = {}  # pid -> time it last entered the ready set
+
+    def key(pid):
+        if algorithm == 'fcfs':
+            return position[pid],
+        if algorithm in ('npp', 'pp'):
+            first = priorities[pid] - aging * (waited[pid] + (t - queued_at[pid] if pid in queued_at else 0))
+        else:
+            first = (burst_time if algorithm == 'sjf' else remaining)[pid]
+        return first, arrival_time[pid], position[pid]
+
+    ready = set()
+    running = None
+    finish = [None] * n
+    segments = []
+    finished = 0
+    t = 0
+    while finished < n:
+        arrivals = [pid for pid in range(n) if arrival_time[pid] == t]
+        for pid in arrivals:
+            ready.add(pid)
+            queued_at[pid] = t
+
+        if ready:
+            best = min(ready, key=key)
+            if running is None or (preemptive and arrivals and key(best) < key(running)):
+                if running is not None:
+                    ready.add(running)
+                    queued_at[running] = t
+                ready.discard(best)
+                waited[best] += t - queued_at.pop(best)
+                running = best
+
+        if running is not None:
+            add_unit(segments, running, t)
+            remaining[running] -= 1
+            if not remaining[running]:
+                finish[running] = t + 1
+                finished += 1
+                running = None
+        t += 1
+    return finish, [tuple(segment) for segment in segments]
+
+
+def outcome(result):
+    """Finish times by process id and (job, start, stop) segments of a result named by process id."""
+    return list(result['solvedProcessesInfo'].table.ft), list(result['ganttChartInfo'].segments())
@@ -0,0 +1,53 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from conftest import outcome, reference, workloads
+from nnp import npp
+from pp import pp
+
+
+def schedule(algorithm, arrival_time, burst_time, priorities, aging):
+    return outcome(algorithm(arrival_time, burst_time, priorities, list(range(len(arrival_time))), aging=aging))
+
+
+@pytest.mark.parametrize('arrival_time, burst_time, priorities, aging', [
+    ([6, 0, 10, 2, 9, 9], [4, 5, 6, 3, 6, 7], [1, 0, 4, 0, 2, 1], 0.1),
+    ([1, 8, 1, 3], [7, 6, 3, 3], [1, 4, 5, 1], 0.3),
+])
+def test_decimal_rates_break_ties_exactly(arrival_time, burst_time, priorities, aging):
+    assert schedule(pp, arrival_time, burst_time, priorities, aging) == \
+        reference('pp', arrival_time, burst_time, priorities, aging)
+
+
+@pytest.mark.parametrize('algorithm', [npp, pp])
+def test_matches_unit_step_simulation(algorithm):
+    # Rate 0 is covered by the engine tests
+    rnd = random.Random(25)
+    for arrival_time, burst_time, priorities in workloads(25, 1500, max_priority=8):
+        aging = rnd.choice([0.1, 0.25, 0.3, 1, 2, Fraction(1, 3)])
+        assert schedule(algorithm, arrival_time, burst_time, priorities, aging) == \
+            reference(algorithm.__name__, arrival_time, burst_time, priorities, aging), \
+            (arrival_time, burst_time, priorities, aging)
+
+
+def test_aging_adds_no_scheduling_points():
+    # Two equal jobs: aging must not make them swap every time unit
+    result = pp([0, 0], [200000, 200000], [1, 1], ['A', 'B'], aging=1)
+    assert len(result['ganttChartInfo']) == 2
+
+    # Each arrival preempts at most once, so a schedule has fewer than two segments per process
+    rnd = random.Random(3)
+    n = 2000
+    arrival_time = [rnd.randint(0, 5000) for _ in range(n)]
+    burst_time = [rnd.randint(1, 20) for _ in range(n)]
+    priorities = [rnd.randint(0, 9) for _ in range(n)]
+    for aging in (0.01, 0.5, 3):
+        result = pp(arrival_time, burst_time, priorities, list(range(n)), aging=aging)
+        assert len(result['ganttChartInfo']) < 2 * n
+
+
+def test_negative_rate_is_rejected():
+    with pytest.raises(ValueError):
+        npp([0], [1], [0], ['A'], aging=-1)
@@ -0,0 +1,57 @@
+from collections import deque
+
+import pytest
+
+from algorithms import run_algorithm
+from conftest import POLICIES, add_unit, outcome, reference, workloads
+
+
+def rr_reference(arrival_time, burst_time, time_quantum):
+    """Unit-step Round Robin: a process whose quantum expires is requeued ahead of the processes that
+    arrived while it ran."""
+    n = len(arrival_time)
+    order = sorted(range(n), key=lambda pid: arrival_time[pid])
+    remaining = list(burst_time)
+    ready_queue = deque()
+    admitted = 0
+    finish = [None] * n
+    segments = []
+    running = None
+    used = 0
+    finished = 0
+    t = 0
+    while finished < n:
+        if running is not None and used == time_quantum:
+            ready_queue.append(running)
+            running = None
+        if running is None:
+            while admitted < n and arrival_time[order[admitted]] <= t:
+                ready_queue.append(order[admitted])
+                admitted += 1
+            if ready_queue:
+                running, used = ready_queue.popleft(), 0
+        if running is not None:
+            add_unit(segments, running, t)
+            remaining[running] -= 1
+            used += 1
+            if not remaining[running]:
+                finish[running] = t + 1
+                finished += 1
+                running = None
+        t += 1
+    return finish, [tuple(segment) for segment in segments]
+
+
+@pytest.mark.parametrize('algorithm', sorted(POLICIES))
+def test_matches_unit_step_simulation(algorithm):
+    for arrival_time, burst_time, priorities in workloads(4, 1000):
+        result = run_algorithm(algorithm, arrival_time, burst_time, list(range(len(arrival_time))), priorities)
+        assert outcome(result) == reference(algorithm, arrival_time, burst_time, priorities), \
+            (arrival_time, burst_time, priorities)
+
+
+@pytest.mark.parametrize('time_quantum', [1, 2, 3, 5])
+def test_rr_matches_unit_step_simulation(time_quantum):
+    for arrival_time, burst_time, _ in workloads(time_quantum, 1000):
+        result = run_algorithm('rr', arrival_time, burst_time, list(range(len(arrival_time))), time_quantum=time_quantum)
+        assert outcome(result) == rr_reference(arrival_time, burst_time, time_quantum), (arrival_time, burst_time)
@@ -0,0 +1,59 @@
+import csv
+import io
+
+import pytest
+
+from algorithms import run_algorithm
+from conftest import workloads
+from export import GANTT_COLUMNS, SOLVED_COLUMNS, read_npz, write_npz, write_stream_csv
+from nnp import iter_npp
+
+# Repeated and non-ASCII names: the archive stores each distinct name once in its dictionary
+NAMES = ['A', 'Ärger', 'A', '进程', 'naïve', '进程', 'B', 'Ärger']
+
+
+def names_for(n):
+    return [NAMES[i % len(NAMES)] for i in range(n)]
+
+
+@pytest.mark.parametrize('algorithm', ['fcfs', 'npp', 'rr'])
+def test_npz_round_trip(algorithm, tmp_path):
+    path = str(tmp_path / 'result.npz')
+    for arrival_time, burst_time, priorities in workloads(23, 100):
+        result = run_algorithm(algorithm, arrival_time, burst_time, names_for(len(arrival_time)), priorities, 2)
+        for compress in (False, True):
+            write_npz(result, path, compress)
+            loaded = read_npz(path)
+            assert list(loaded['solvedProcessesInfo']) == list(result['solvedProcessesInfo'])
+            assert list(loaded['ganttChartInfo']) == list(result['ganttChartInfo'])
+
+
+def test_npz_loads_with_numpy(tmp_path):
+    np = pytest.importorskip('numpy')
+    path = str(tmp_path / 'result.npz')
+    result = run_algorithm('npp', [0, 1, 1], [2, 1, 3], ['进程', 'A', '进程'], [1, 0, 0])
+    write_npz(result, path)
+    with np.load(path) as archive:
+        assert archive['ft'].dtype == np.int64
+        assert archive['ft'].tolist() == [record['ft'] for record in result['solvedProcessesInfo']]
+        dictionary = archive['job_dictionary_data'].tobytes().decode()
+        assert dictionary == '进程A'
+
+
+def test_stream_csv_rows():
+    arrival_time, burst_time, priorities = [0, 2, 2, 5, 1], [3, 2, 1, 4, 2], [2, 1, 0, 3, 1]
+    names = names_for(len(arrival_time))
+    solved_file, gantt_file = io.StringIO(), io.StringIO()
+    write_stream_csv(iter_npp(arrival_time, burst_time, priorities, names), solved_file, gantt_file)
+
+    expected = run_algorithm('npp', arrival_time, burst_time, names, priorities)
+    # Processes are written in completion order
+    records = sorted(expected['solvedProcessesInfo'], key=lambda record: record['ft'])
+    solved_rows = list(csv.reader(io.StringIO(solved_file.getvalue())))
+    assert solved_rows[0] == list(SOLVED_COLUMNS)
+    assert solved_rows[1:] == [[str(record[column]) for column in SOLVED_COLUMNS] for record in records]
+
+    gantt_rows = list(csv.reader(io.StringIO(gantt_file.getvalue())))
+    assert gantt_rows[0] == list(GANTT_COLUMNS)
+    assert gantt_rows[1:] == [[str(segment[column]) for column in GANTT_COLUMNS]
+                              for segment in expected['ganttChartInfo']]
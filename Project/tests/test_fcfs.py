@@ -0,0 +1,37 @@
+import pytest
+
+from conftest import workloads
+from FCFS import fcfs, fcfs_chunked, fcfs_vectorized
+
+pytest.importorskip('numpy')
+
+
+def fcfs_workloads(seed, count):
+    yield [], [], []
+    # A horizon far beyond the total burst leaves the CPU idle between jobs
+    for arrival_time, burst_time, _ in workloads(seed, count, size=20, horizon=60, max_burst=6):
+        yield arrival_time, burst_time, [f'P{i}' for i in range(len(arrival_time))]
+
+
+def assert_same(result, expected):
+    assert list(result['solvedProcessesInfo']) == list(expected['solvedProcessesInfo'])
+    assert list(result['ganttChartInfo']) == list(expected['ganttChartInfo'])
+
+
+def test_vectorized_matches_fcfs():
+    for arrival_time, burst_time, names in fcfs_workloads(7, 300):
+        assert_same(fcfs_vectorized(arrival_time, burst_time, names), fcfs(arrival_time, burst_time, names))
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_chunk_boundaries_are_stitched(max_workers):
+    for arrival_time, burst_time, names in fcfs_workloads(max_workers, 15):
+        expected = fcfs(arrival_time, burst_time, names)
+        for chunk_size in range(1, 8):
+            assert_same(fcfs_chunked(arrival_time, burst_time, names, chunk_size=chunk_size, max_workers=max_workers),
+                        expected)
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        fcfs_chunked([0], [1], ['A'], chunk_size=0)
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from incremental import IncrementalScheduler
+from metrics import Metrics
+
+
+def workload(rnd, n):
+    return [[f'P{i}', rnd.randint(0, 300), rnd.randint(1, 9), rnd.randint(0, 4)] for i in range(n)]
+
+
+def run(scheduler, algorithm, processes, metrics=None):
+    args = (algorithm, [p[1] for p in processes], [p[2] for p in processes], [p[0] for p in processes],
+            [p[3] for p in processes])
+    if scheduler is None:
+        return run_algorithm(*args, metrics=metrics)
+    return scheduler.run(*args, metrics=metrics)
+
+
+def assert_same(result, full):
+    assert list(result['solvedProcessesInfo']) == list(full['solvedProcessesInfo'])
+    assert list(result['ganttChartInfo']) == list(full['ganttChartInfo'])
+
+
+def late(processes):
+    # Index of a process arriving in the second half, so that an edit to it leaves a prefix to reuse
+    return max(range(len(processes)), key=lambda i: processes[i][1])
+
+
+def insert(processes):
+    processes.append(['new', processes[late(processes)][1], 4, 1])
+
+
+def delete(processes):
+    del processes[late(processes)]
+
+
+def change(processes):
+    processes[late(processes)][2] += 3
+
+
+@pytest.mark.parametrize('algorithm', ['fcfs', 'sjf', 'npp'])
+@pytest.mark.parametrize('edit', [insert, delete, change])
+def test_resume_matches_full_run(algorithm, edit):
+    processes = workload(random.Random(18), 60)
+    scheduler = IncrementalScheduler()
+    run(scheduler, algorithm, processes)
+    edit(processes)
+    metrics, full_metrics = Metrics(), Metrics()
+    result = run(scheduler, algorithm, processes, metrics)
+    assert scheduler.resumed_from
+    assert_same(result, run(None, algorithm, processes, full_metrics))
+    assert metrics.report() == full_metrics.report()
+
+
+@pytest.mark.parametrize('algorithm', ['fcfs', 'sjf', 'npp', 'pp', 'rr'])
+def test_random_edits_match_full_runs(algorithm):
+    rnd = random.Random(5)
+    scheduler = IncrementalScheduler()
+    processes = workload(rnd, 3)
+    for _ in range(150):
+        op = rnd.random()
+        if op < 0.6 or len(processes) < 3:
+            processes.append([f'P{rnd.randint(0, 40)}', rnd.randint(0, 200), rnd.randint(0, 12), rnd.randint(0, 4)])
+        elif op < 0.85:
+            del processes[rnd.randrange(len(processes))]
+        else:
+            processes[rnd.randrange(len(processes))][2] = rnd.randint(1, 9)
+        if algorithm == 'rr':
+            args = ([p[1] for p in processes], [p[2] for p in processes], [p[0] for p in processes], None, 3)
+            assert_same(scheduler.run(algorithm, *args), run_algorithm(algorithm, *args))
+        else:
+            assert_same(run(scheduler, algorithm, processes), run(None, algorithm, processes))
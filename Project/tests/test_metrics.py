@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from metrics import Metrics
+
+
+@pytest.mark.parametrize('algorithm', ['fcfs', 'sjf', 'npp', 'pp', 'srtf', 'rr'])
+def test_response_times_are_first_dispatches(algorithm):
+    rnd = random.Random(24)
+    for _ in range(200):
+        n = rnd.randint(1, 12)
+        arrival_time = [rnd.randint(0, 20) for _ in range(n)]
+        burst_time = [rnd.randint(1, 6) for _ in range(n)]
+        priorities = [rnd.randint(0, 3) for _ in range(n)]
+        metrics = Metrics()
+        result = run_algorithm(algorithm, arrival_time, burst_time, list(range(n)), priorities, 2, metrics=metrics)
+        first_start = {}
+        for job, start, _ in result['ganttChartInfo'].segments():
+            first_start.setdefault(job, start)
+        response = sorted(first_start[pid] - arrival_time[pid] for pid in range(n))
+        report = metrics.report()['responseTime']
+        assert report['mean'] == pytest.approx(sum(response) / n)
+        assert report['max'] == response[-1]
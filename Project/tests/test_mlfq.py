@@ -0,0 +1,49 @@
+import pytest
+
+from conftest import workloads
+from mlfq import mlfq
+from rr import rr
+
+
+def segments(result):
+    return [(segment['job'], segment['start'], segment['stop']) for segment in result['ganttChartInfo']]
+
+
+@pytest.mark.parametrize('time_quantum', [1, 2, 3, 5])
+def test_single_level_without_boost_is_round_robin(time_quantum):
+    for arrival_time, burst_time, _ in workloads(time_quantum, 300):
+        names = [f'P{i}' for i in range(len(arrival_time))]
+        result = mlfq(arrival_time, burst_time, [time_quantum], names, boost_interval=0)
+        expected = rr(arrival_time, burst_time, time_quantum, names)
+        assert list(result['solvedProcessesInfo']) == list(expected['solvedProcessesInfo'])
+        assert segments(result) == segments(expected)
+
+
+def test_full_quantum_demotes_one_level():
+    result = mlfq([0, 0], [5, 1], [2, 4, 8], ['A', 'B'], boost_interval=0)
+    # A uses its quantum of 2, B runs at the top level, then A finishes with the level 1 quantum
+    assert segments(result) == [('A', 0, 2), ('B', 2, 3), ('A', 3, 6)]
+    assert result['mlfqInfo']['demotions'] == 1
+    assert result['mlfqInfo']['levelTime'] == [3, 3, 0]
+
+
+def test_arrival_preempts_lower_level_to_head_of_queue():
+    result = mlfq([0, 0, 5], [6, 6, 1], [2, 8], ['A', 'C', 'B'], boost_interval=0)
+    # B's arrival cuts A's level 1 slice short; A then runs again ahead of C
+    assert segments(result) == [('A', 0, 2), ('C', 2, 4), ('A', 4, 5), ('B', 5, 6), ('A', 6, 9), ('C', 9, 13)]
+    assert result['mlfqInfo']['preemptions'] == 1
+    assert result['mlfqInfo']['demotions'] == 2
+
+
+def test_boost_moves_lower_levels_to_top_in_level_order():
+    result = mlfq([0, 0, 0], [5, 5, 3], [1, 2, 4], ['A', 'B', 'C'], boost_interval=6)
+    # At time 7, C waits at level 1 and A, B at level 2: the boost queues them as C, A, B
+    assert segments(result) == [('A', 0, 1), ('B', 1, 2), ('C', 2, 3), ('A', 3, 5), ('B', 5, 7),
+                                ('C', 7, 8), ('A', 8, 9), ('B', 9, 10),
+                                ('C', 10, 11), ('A', 11, 12), ('B', 12, 13)]
+    assert result['mlfqInfo']['boosts'] == 2
+
+
+def test_negative_boost_interval_is_rejected():
+    with pytest.raises(ValueError):
+        mlfq([0], [1], 2, ['A'], boost_interval=-1)
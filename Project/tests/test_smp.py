@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from conftest import workloads
+from smp import POLICIES, smp
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_one_core_matches_single_cpu(policy):
+    for arrival_time, burst_time, priorities in workloads(7, 200, size=30, horizon=40, max_burst=9, max_priority=3):
+        names = [f'P{i}' for i in range(len(arrival_time))]
+        result = smp(arrival_time, burst_time, names, 1, policy, priorities, 3)
+        single = run_algorithm(policy, arrival_time, burst_time, names, priorities, 3)
+        assert list(result['solvedProcessesInfo']) == list(single['solvedProcessesInfo']), (arrival_time, burst_time)
+        assert list(result['ganttChartInfo']) == list(single['ganttChartInfo']), (arrival_time, burst_time)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_cores_run_each_process_for_its_burst_time(policy):
+    rnd = random.Random(20)
+    for arrival_time, burst_time, priorities in workloads(policy, 50, size=30, horizon=40, max_burst=9, max_priority=3):
+        n = len(arrival_time)
+        result = smp(arrival_time, burst_time, list(range(n)), rnd.randint(2, 6), policy, priorities, 2)
+        ran = [0] * n
+        segments = []
+        for chart in result['coreGanttChartInfo']:
+            previous_stop = 0
+            for segment in chart:
+                job, start, stop = segment['job'], segment['start'], segment['stop']
+                assert previous_stop <= start and arrival_time[job] <= start
+                previous_stop = stop
+                ran[job] += stop - start
+                segments.append((job, start, stop))
+        assert ran == burst_time
+        # A process never runs on two cores at once
+        segments.sort()
+        for (job, _, stop), (next_job, next_start, _) in zip(segments, segments[1:]):
+            assert job != next_job or stop <= next_start
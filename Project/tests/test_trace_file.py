@@ -0,0 +1,41 @@
+import pytest
+
+from algorithms import ENGINES, run_algorithm
+from conftest import workloads
+from trace_file import open_trace, write_trace
+
+NAMES = ['Ärger', 'naïve', '进程', 'P', 'Ω-job', 'émile', 'job 7', '🙂']
+
+
+@pytest.mark.parametrize('algorithm', sorted(ENGINES))
+def test_round_trip_schedules_like_run_algorithm(algorithm, tmp_path):
+    path = str(tmp_path / 'workload.trace')
+    for arrival_time, burst_time, priorities in workloads(22, 50):
+        names = [NAMES[i % len(NAMES)] + str(i // len(NAMES)) for i in range(len(arrival_time))]
+        write_trace(path, arrival_time, burst_time, names, priorities)
+        expected = run_algorithm(algorithm, arrival_time, burst_time, names, priorities, 2)
+        with open_trace(path, use_numpy=False) as trace:
+            assert list(trace.names) == names
+            result = trace.schedule(algorithm, 2)
+            assert list(result['solvedProcessesInfo']) == list(expected['solvedProcessesInfo'])
+            assert list(result['ganttChartInfo']) == list(expected['ganttChartInfo'])
+
+
+def test_numpy_columns_match(tmp_path):
+    pytest.importorskip('numpy')
+    path = str(tmp_path / 'workload.trace')
+    write_trace(path, [3, 0, 1], [2, 4, 1], NAMES[:3], [1, 0, 2])
+    with open_trace(path, use_numpy=True) as trace:
+        assert trace.at.tolist() == [3, 0, 1]
+        assert trace.bt.tolist() == [2, 4, 1]
+        assert trace.priority.tolist() == [1, 0, 2]
+        assert list(trace.names) == NAMES[:3]
+
+
+def test_trace_without_priorities_rejects_priority_algorithms(tmp_path):
+    path = str(tmp_path / 'workload.trace')
+    write_trace(path, [0], [1], ['A'])
+    with open_trace(path) as trace:
+        assert trace.priority is None
+        with pytest.raises(ValueError):
+            trace.schedule('npp')
@@ -0,0 +1,212 @@
+"""Binary workload traces: fixed-width process records that open with mmap instead of being parsed.
+
+Layout (little-endian):
+    header   64 bytes: magic, version, flags, process count, name table offset and size
+    records  one (arrival_time, burst_time, priority, name_offset) int64 tuple per process
+    names    NUL-terminated UTF-8 job names; name_offset is relative to the start of the table
+
+Example:
+    python trace_file.py processes.csv workload.trace
+"""
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Any, Iterator, Optional, Sequence
+
+from algorithms import ENGINES, PRIORITY_ALGORITHMS, load_engine
+from instrumentation import attach
+from metrics import Metrics
+from process_table import ProcessTable
+from progress import Progress
+from streaming import collect
+
+MAGIC = b'SCHTRACE'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQ')
+HEADER_SIZE = 64  # HEADER padded so the records start 8-byte aligned
+RECORD_FIELDS = 4
+RECORD_SIZE = 8 * RECORD_FIELDS
+FLAG_PRIORITIES = 1
+CHUNK_SIZE = 1 << 16  # Records written per chunk
+
+# memoryview.cast() reads native byte order, which matches the file only on little-endian machines
+_NATIVE = sys.byteorder == 'little'
+
+
+def write_trace(path: str, arrival_time: Sequence[int], burst_time: Sequence[int], process_names: Sequence[str],
+                priorities: Optional[Sequence[int]] = None) -> None:
+    """Write a workload as a binary trace, CHUNK_SIZE records at a time."""
+    n = len(arrival_time)
+    if len(burst_time) != n or len(process_names) != n:
+        raise ValueError("Arrival times, burst times and process names must have the same length.")
+    if priorities is not None and len(priorities) != n:
+        raise ValueError("Arrival times and priorities must have the same length.")
+
+    name_table = bytearray()
+    with open(path, 'wb') as f:
+        f.write(bytes(HEADER_SIZE))  # Filled in once the name table size is known
+        for start in range(0, n, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, n)
+            records = array('q', bytes(RECORD_SIZE * (stop - start)))
+            records[0::RECORD_FIELDS] = array('q', arrival_time[start:stop])
+            records[1::RECORD_FIELDS] = array('q', burst_time[start:stop])
+            if priorities is not None:
+                records[2::RECORD_FIELDS] = array('q', priorities[start:stop])
+            offsets = array('q')
+            for name in process_names[start:stop]:
+                encoded = str(name).encode()
+                if b'\0' in encoded:
+                    raise ValueError(f"Process name {name!r} contains a NUL character.")
+                offsets.append(len(name_table))
+                name_table += encoded + b'\0'
+            records[3::RECORD_FIELDS] = offsets
+            if not _NATIVE:
+                records.byteswap()
+            f.write(records)
+
+        f.write(name_table)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, FLAG_PRIORITIES if priorities is not None else 0, n,
+                            HEADER_SIZE + RECORD_SIZE * n, len(name_table)))
+
+
+class TraceNames:
+    """Job names of a trace, decoded from the mapped name table only when asked for."""
+
+    __slots__ = ('_buffer', '_start', '_end', '_offsets')
+
+    def __init__(self, buffer, start: int, end: int, offsets: Sequence[int]):
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, pid: int) -> str:
+        start = self._start + int(self._offsets[pid])
+        stop = self._buffer.find(b'\0', start, self._end)
+        return self._buffer[start:stop].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[pid] for pid in range(len(self)))
+
+
+class Trace:
+    """A memory-mapped trace; at, bt, priority and names are read straight from the file.
+
+    The columns are strided views of the mapping (NumPy memmap columns with use_numpy=True),
+    so opening a trace costs the same whatever its size. They, and any ProcessTable built on
+    them, are only valid until close().
+    """
+
+    def __init__(self, path: str, use_numpy: bool = False):
+        if use_numpy:
+            # Imported on first use, so that the plain path and the converter never pay for it
+            try:
+                import numpy as np
+            except ImportError:
+                raise ImportError("Memory-mapping a trace as NumPy arrays requires numpy (pip install numpy).") from None
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < HEADER_SIZE:
+                raise ValueError(f"{path} is not a scheduler trace.")
+            magic, version, flags, n, names_start, names_size = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a scheduler trace.")
+            if version != VERSION:
+                raise ValueError(f"Unsupported trace version {version} in {path}.")
+            if names_start != HEADER_SIZE + RECORD_SIZE * n or names_start + names_size > len(self._mmap):
+                raise ValueError(f"{path} is truncated.")
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self._views = []
+        if use_numpy:
+            records = np.memmap(path, dtype='<i8', mode='r', offset=HEADER_SIZE, shape=(n, RECORD_FIELDS))
+            columns = [records[:, field] for field in range(RECORD_FIELDS)]
+        elif _NATIVE:
+            records = memoryview(self._mmap)[HEADER_SIZE:names_start].cast('q')
+            columns = [records[field::RECORD_FIELDS] for field in range(RECORD_FIELDS)]
+            self._views = [records] + columns
+        else:
+            # Big-endian machine: the columns have to be copied and byte-swapped
+            records = array('q', self._mmap[HEADER_SIZE:names_start])
+            records.byteswap()
+            columns = [records[field::RECORD_FIELDS] for field in range(RECORD_FIELDS)]
+
+        self.path = path
+        self.at, self.bt, priority, name_offset = columns
+        self.priority = priority if flags & FLAG_PRIORITIES else None
+        self.names = TraceNames(self._mmap, names_start, names_start + names_size, name_offset)
+
+    def __len__(self) -> int:
+        return len(self.at)
+
+    def __enter__(self) -> 'Trace':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Views must be released before the mapping can be closed
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.at = self.bt = self.priority = self.names = None
+        self._mmap.close()
+
+    def table(self, with_priorities: bool = True) -> ProcessTable:
+        """A ProcessTable over the mapped columns; only the result columns are allocated."""
+        return ProcessTable.from_columns(self.at, self.bt, self.names, self.priority if with_priorities else None)
+
+    def schedule(self, algorithm: str, time_quantum: Optional[int] = None,
+                 progress: Optional[Progress] = None, metrics: Optional[Metrics] = None) -> Dict[str, Any]:
+        """Run an algorithm's engine (see algorithms.ENGINES) on the trace without copying its columns."""
+        if algorithm in PRIORITY_ALGORITHMS and self.priority is None:
+            raise ValueError(f"{self.path} has no priorities.")
+        if algorithm not in ENGINES:
+            raise ValueError(f"Scheduling a trace is not supported for {algorithm}.")
+        if algorithm == 'rr' and (not isinstance(time_quantum, int) or time_quantum <= 0):
+            raise ValueError("Time quantum must be a positive integer.")
+
+        processes = self.table(algorithm in PRIORITY_ALGORITHMS)
+        engine = load_engine(algorithm)
+        events = engine(processes, time_quantum) if algorithm == 'rr' else engine(processes)
+        gantt_chart_info = collect(processes, events, progress, metrics=metrics)
+
+        return attach(None, {'solvedProcessesInfo': processes.result_view(algorithm), 'ganttChartInfo': gantt_chart_info}, metrics)
+
+
+def open_trace(path: str, use_numpy: bool = False) -> Trace:
+    return Trace(path, use_numpy)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from cli import read_processes
+
+    parser = argparse.ArgumentParser(description="Convert a CSV or JSON process list to a binary trace.")
+    parser.add_argument('input', help="CSV or JSON file with name, arrival_time, burst_time[, priority]; '-' for stdin")
+    parser.add_argument('output', help="trace file to write")
+    parser.add_argument('--input-format', choices=('csv', 'json'), help="default: guessed from the file extension")
+    args = parser.parse_args(argv)
+
+    try:
+        processes = read_processes(args.input, args.input_format)
+        priorities = [p.get('priority', 0) for p in processes] if any('priority' in p for p in processes) else None
+        write_trace(args.output, [p['arrival_time'] for p in processes], [p['burst_time'] for p in processes],
+                    [p['name'] for p in processes], priorities)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())